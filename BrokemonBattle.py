@@ -1,88 +1,144 @@
 #!/usr/bin/env python3
+import bisect
 import curses
+import heapq
 import json
+import math
 import os
 import random
+import sys
 import time
-from dataclasses import dataclass, field
-from typing import Callable, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Tuple
+
+# One generator for every battle roll, so a run can be replayed with _RNG.seed(n)
+_RNG = random.Random()
+_rand = _RNG.random
+_choice = _RNG.choice
+
+# Simulation code sets this to run perform_move with no screen (stdscr may be None)
+HEADLESS = False
 
 
 # -------------------------
 # Curses Color Manager
 # -------------------------
 class CursesColors:
+    # Foreground/background of each base pair; pairs are only initialized on first use
+    PAIR_SPECS = {
+        'red': (curses.COLOR_RED, -1),
+        'green': (curses.COLOR_GREEN, -1),
+        'yellow': (curses.COLOR_YELLOW, -1),
+        'blue': (curses.COLOR_BLUE, -1),
+        'magenta': (curses.COLOR_MAGENTA, -1),
+        'cyan': (curses.COLOR_CYAN, -1),
+        'white': (curses.COLOR_WHITE, -1),
+
+        'black_on_green': (curses.COLOR_BLACK, curses.COLOR_GREEN),
+        'black_on_red': (curses.COLOR_BLACK, curses.COLOR_RED),
+        'black_on_yellow': (curses.COLOR_BLACK, curses.COLOR_YELLOW),
+        'black_on_blue': (curses.COLOR_BLACK, curses.COLOR_BLUE),
+    }
+    PREFIX_ATTRS = {'bright': curses.A_BOLD, 'dim': curses.A_DIM}
+
     def __init__(self):
         self.color_pairs = {}
+        self.colors_enabled = False
+        self._next_pair = 1
+        self._attr_cache = {}
         self.init_colors()
     
     def init_colors(self):
         if curses.has_colors():
             curses.start_color()
             curses.use_default_colors()
-            
-            curses.init_pair(1, curses.COLOR_RED, -1)
-            curses.init_pair(2, curses.COLOR_GREEN, -1)
-            curses.init_pair(3, curses.COLOR_YELLOW, -1)
-            curses.init_pair(4, curses.COLOR_BLUE, -1)
-            curses.init_pair(5, curses.COLOR_MAGENTA, -1)
-            curses.init_pair(6, curses.COLOR_CYAN, -1)
-            curses.init_pair(7, curses.COLOR_WHITE, -1)
-            
-            curses.init_pair(8, curses.COLOR_BLACK, curses.COLOR_GREEN)
-            curses.init_pair(9, curses.COLOR_BLACK, curses.COLOR_RED)
-            curses.init_pair(10, curses.COLOR_BLACK, curses.COLOR_YELLOW)
-            curses.init_pair(11, curses.COLOR_BLACK, curses.COLOR_BLUE)
-
-            self.color_pairs = {
-                'red': curses.color_pair(1),
-                'green': curses.color_pair(2), 
-                'yellow': curses.color_pair(3),
-                'blue': curses.color_pair(4),
-                'magenta': curses.color_pair(5),
-                'cyan': curses.color_pair(6),
-                'white': curses.color_pair(7),
-                
-                'bright_red': curses.color_pair(1),
-                'bright_green': curses.color_pair(2),
-                'bright_yellow': curses.color_pair(3),
-                'bright_blue': curses.color_pair(4),
-                'bright_magenta': curses.color_pair(5),
-                'bright_cyan': curses.color_pair(6),
-                'bright_white': curses.color_pair(7),
-
-                'black_on_green': curses.color_pair(8),
-                'black_on_red': curses.color_pair(9),
-                'black_on_yellow': curses.color_pair(10),
-                'black_on_blue': curses.color_pair(11),
-
-                'dim_white': curses.color_pair(7),
-            }
+            self.colors_enabled = True
+    
+    def _color_pair(self, base_color_name: str):
+        pair = self.color_pairs.get(base_color_name)
+        if pair is None:
+            spec = self.PAIR_SPECS.get(base_color_name)
+            if spec is None or not self.colors_enabled:
+                return curses.A_NORMAL
+            curses.init_pair(self._next_pair, *spec)
+            pair = self.color_pairs[base_color_name] = curses.color_pair(self._next_pair)
+            self._next_pair += 1
+        return pair
     
     def get_color_attr(self, color_name: str):
-        attr = 0
-        
-        if color_name.startswith('bright_'):
-            attr |= curses.A_BOLD
-            base_color_name = color_name[len('bright_'):]
-            color_pair = self.color_pairs.get(base_color_name, curses.A_NORMAL)
-        elif color_name.startswith('dim_'):
-            attr |= curses.A_DIM
-            base_color_name = color_name[len('dim_'):]
-            color_pair = self.color_pairs.get(base_color_name, curses.A_NORMAL)
-        else:
-            color_pair = self.color_pairs.get(color_name, curses.A_NORMAL)
-        
-        return color_pair | attr
+        attr = self._attr_cache.get(color_name)
+        if attr is None:
+            attr = self._attr_cache[color_name] = self._resolve_color_attr(color_name)
+        return attr
+    
+    def _resolve_color_attr(self, color_name: str):
+        # bright_/dim_ names reuse the base pair with a text attribute on top
+        prefix, _, base_color_name = color_name.partition('_')
+        attr = self.PREFIX_ATTRS.get(prefix)
+        if attr is None:
+            return self._color_pair(color_name)
+        return self._color_pair(base_color_name) | attr
+
+# Synchronized-update escapes (DEC private mode 2026): supporting terminals
+# hold the frame until the end marker and paint it in one go; others ignore them.
+SYNC_BEGIN = "\x1b[?2026h"
+SYNC_END = "\x1b[?2026l"
+
+def commit(stdscr):
+    """Flush everything drawn since the last commit to the terminal as one frame"""
+    stdscr.noutrefresh()
+    sys.stdout.write(SYNC_BEGIN)
+    sys.stdout.flush()
+    curses.doupdate()
+    sys.stdout.write(SYNC_END)
+    sys.stdout.flush()
+
+class FrameClock:
+    """Paces animation frames against fixed monotonic deadlines so draw time doesn't add to the delay"""
+    __slots__ = ('period', 'next')
+
+    def __init__(self, fps=30):
+        self.period = 1 / fps
+        self.next = time.monotonic() + self.period
+
+    def behind(self):
+        """True once the current frame's deadline has passed; callers skip drawing it to catch up"""
+        return time.monotonic() > self.next
+
+    def tick(self):
+        delay = self.next - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self.next += self.period
 
 def curses_center_text(stdscr, text, y, color_attr=curses.A_NORMAL):
     """Centers text horizontally on the given y-coordinate in curses."""
     max_y, max_x = stdscr.getmaxyx()
     x = max(0, (max_x - len(text)) // 2)
-    try:
-        stdscr.addstr(y, x, text, color_attr)
-    except curses.error:
-        pass
+    # addnstr truncates at the right edge instead of wrapping, and stopping short
+    # of the last column keeps it from raising on the bottom-right cell
+    if 0 <= y < max_y:
+        stdscr.addnstr(y, x, text, max_x - x - 1, color_attr)
+
+# Bar bodies are sliced out of these, so bars can be at most _BAR_MAX cells long
+_BAR_MAX = 256
+_BAR_FULL = "\u2588" * _BAR_MAX
+_BAR_EMPTY = "-" * _BAR_MAX
+
+def _build_bars(length):
+    """Every bar body for a bar of the given length, indexed by fill level"""
+    assert length <= _BAR_MAX
+    return [f"[{_BAR_FULL[:f]}{_BAR_EMPTY[:length - f]}]" for f in range(length + 1)]
+
+# Bar bodies indexed by fill level, keyed by bar length
+_BAR_CACHE = {20: _build_bars(20)}
+# HP bar colors indexed by (ratio > 0.25) + (ratio > 0.5)
+_HP_COLORS = ('bright_red', 'bright_yellow', 'bright_green')
+# Fill ratio -> color name for each bar type; unknown types draw in white
+_BAR_COLORS = {
+    'hp': lambda ratio: _HP_COLORS[(ratio > 0.25) + (ratio > 0.5)],
+    'energy': lambda ratio: 'cyan',
+}
 
 def curses_bar(stdscr, y, x, value, maximum, length=20, color_type="hp", color_mgr=None):
     """Draw a colored HP/energy bar using curses"""
@@ -91,30 +147,40 @@ def curses_bar(stdscr, y, x, value, maximum, length=20, color_type="hp", color_m
     else:
         ratio = value / maximum
     
-    filled = int(ratio * length)
-    empty = length - filled
-    
-    if color_type == "hp":
-        if ratio > 0.5:
-            color_name = 'bright_green'
-        elif ratio > 0.25:
-            color_name = 'bright_yellow'
-        else:
-            color_name = 'bright_red'
-    elif color_type == "energy":
-        color_name = 'cyan'
-    else:
-        color_name = 'white'
+    filled = min(length, max(0, int(ratio * length)))
     
+    pick_color = _BAR_COLORS.get(color_type)
+    color_name = pick_color(ratio) if pick_color else 'white'
     color_attr = color_mgr.get_color_attr(color_name) if color_mgr else curses.A_NORMAL
     
-    bar_str = "[" + "\u2588" * filled + "-" * empty + "]"
+    bars = _BAR_CACHE.get(length)
+    if bars is None:
+        bars = _BAR_CACHE[length] = _build_bars(length)
+    bar_str = bars[filled]
+    
     max_y, max_x = stdscr.getmaxyx()
-    if y < max_y and x + len(bar_str) < max_x:
-        try:
-            stdscr.addstr(y, x, bar_str, color_attr)
-        except curses.error:
-            pass
+    if 0 <= y < max_y and 0 <= x < max_x - 1:
+        stdscr.addnstr(y, x, bar_str, max_x - x - 1, color_attr)
+
+def _menu_row_styles(color_mgr=None, show_arrow=True):
+    """Resolve (normal_attr, selected_attr, normal_prefix, selected_prefix) for menu rows"""
+    if color_mgr:
+        normal_attr = color_mgr.get_color_attr('white')
+        selected_attr = color_mgr.get_color_attr('black_on_yellow') | curses.A_BOLD
+    else:
+        normal_attr = curses.A_NORMAL
+        selected_attr = curses.A_REVERSE
+    if show_arrow:
+        return normal_attr, selected_attr, "  ", "\u25ba "
+    return normal_attr, selected_attr, "", ""
+
+def _draw_menu_row(stdscr, y, x, item, highlighted, styles, max_width):
+    """Draw a single menu row in its normal or highlighted state"""
+    normal_attr, selected_attr, normal_prefix, selected_prefix = styles
+    if highlighted:
+        stdscr.addnstr(y, x, selected_prefix + item, max_width - x - 1, selected_attr)
+    else:
+        stdscr.addnstr(y, x, normal_prefix + item, max_width - x - 1, normal_attr)
 
 def draw_menu(stdscr, items, selected_idx, start_y, start_x, title="", color_mgr=None, show_arrow=True):
     """Draw a menu with arrow navigation support"""
@@ -125,36 +191,59 @@ def draw_menu(stdscr, items, selected_idx, start_y, start_x, title="", color_mgr
         stdscr.addstr(start_y, start_x, title, title_attr)
         start_y += 1
     
+    normal_attr, selected_attr, normal_prefix, selected_prefix = _menu_row_styles(color_mgr, show_arrow)
     for i, item in enumerate(items):
         y = start_y + i
         if y >= max_height - 2:
             break
-            
         if i == selected_idx:
-            attr = color_mgr.get_color_attr('black_on_yellow') | curses.A_BOLD if color_mgr else curses.A_REVERSE
-            prefix = "\u25ba " if show_arrow else ""
-            stdscr.addstr(y, start_x, f"{prefix}{item}", attr)
+            stdscr.addnstr(y, start_x, selected_prefix + item, max_width - start_x - 1, selected_attr)
         else:
-            attr = color_mgr.get_color_attr('white') if color_mgr else curses.A_NORMAL
-            prefix = "  " if show_arrow else ""
-            stdscr.addstr(y, start_x, f"{prefix}{item}", attr)
+            stdscr.addnstr(y, start_x, normal_prefix + item, max_width - start_x - 1, normal_attr)
+
+# Instruction lines for the selection menus; drawn once per full paint, never per keypress
+_INST_SINGLE = "Use \u2191\u2193 to navigate, ENTER to select"
+_INST_MULTI = "Use \u2191\u2193 to navigate, SPACE to toggle, ENTER to confirm"
+
+def _block_for_input(stdscr):
+    """Make getch wait for a key so menu loops never spin on a nodelay/timeout window"""
+    stdscr.nodelay(False)
+    stdscr.timeout(-1)
+
+def wait_or_skip(stdscr, seconds):
+    """Pause for up to the given seconds; any key press ends the pause early"""
+    stdscr.timeout(int(seconds * 1000))
+    stdscr.getch()
+    _block_for_input(stdscr)
 
 def get_menu_selection(stdscr, items, title="", start_y=2, start_x=2, color_mgr=None):
     """Handle arrow key navigation for menu selection"""
+    _block_for_input(stdscr)
     selected_idx = 0
-    max_height, max_width = stdscr.getmaxyx()
+    styles = _menu_row_styles(color_mgr)
+    # Rows hidden by the screen edge or covered by the instructions are never repainted
+    items_y = start_y + (1 if title and color_mgr else 0)
     
-    while True:
+    def draw_all():
+        nonlocal max_height, max_width, row_limit
+        max_height, max_width = stdscr.getmaxyx()
         stdscr.clear()
         draw_menu(stdscr, items, selected_idx, start_y, start_x, title, color_mgr)
         
+        inst_y = max_height - 3
         if color_mgr:
             inst_attr = color_mgr.get_color_attr('bright_yellow')
-            stdscr.addstr(max_height - 3, start_x, "Use \u2191\u2193 to navigate, ENTER to select", inst_attr)
-        
-        stdscr.refresh()
-        
+            stdscr.addstr(inst_y, start_x, _INST_SINGLE, inst_attr)
+        row_limit = inst_y if color_mgr else max_height - 2
+        commit(stdscr)
+    
+    # Draw the whole menu once; keypresses below only repaint the rows that change
+    max_height = max_width = row_limit = 0
+    draw_all()
+    
+    while True:
         key = stdscr.getch()
+        prev_idx = selected_idx
         
         if key == curses.KEY_UP:
             selected_idx = (selected_idx - 1) % len(items)
@@ -164,47 +253,67 @@ def get_menu_selection(stdscr, items, title="", start_y=2, start_x=2, color_mgr=
             return selected_idx
         elif key == ord('q'):
             return -1
+        elif key == curses.KEY_RESIZE:
+            draw_all()
+            continue
+        
+        if selected_idx != prev_idx:
+            for idx in (prev_idx, selected_idx):
+                y = items_y + idx
+                if y < row_limit:
+                    stdscr.move(y, start_x)
+                    stdscr.clrtoeol()
+                    _draw_menu_row(stdscr, y, start_x, items[idx], idx == selected_idx, styles, max_width)
+            commit(stdscr)
 
 def get_multi_selection(stdscr, items, min_selections, max_selections, title="", start_y=2, start_x=2, color_mgr=None):
     """Handle arrow key navigation for multiple item selection, with space to toggle."""
+    _block_for_input(stdscr)
     selected_indices = []
     current_idx = 0
-    max_height, max_width = stdscr.getmaxyx()
-
-    while True:
+    display_y = start_y + (1 if title else 0)
+    
+    normal_attr, selected_attr, _, _ = _menu_row_styles(color_mgr, show_arrow=False)
+    
+    def draw_row(i):
+        prefix = "[X] " if i in selected_indices else "[ ] "
+        attr = selected_attr if i == current_idx else normal_attr
+        stdscr.addnstr(display_y + i, start_x, prefix + items[i], max_width - start_x - 1, attr)
+    
+    def draw_counter():
+        stdscr.move(inst_y + 1, start_x)
+        stdscr.clrtoeol()
+        stdscr.addstr(inst_y + 1, start_x, f"Selected: {len(selected_indices)}/{max_selections}", normal_attr)
+    
+    def draw_all():
+        nonlocal max_height, max_width, inst_y
+        max_height, max_width = stdscr.getmaxyx()
+        inst_y = max_height - 3
         stdscr.clear()
         
         if title and color_mgr:
             title_attr = color_mgr.get_color_attr('bright_cyan') | curses.A_BOLD
             stdscr.addstr(start_y, start_x, title, title_attr)
         
-        display_y = start_y + (1 if title else 0)
-
-        for i, item in enumerate(items):
-            y = display_y + i
-            if y >= max_height - 3:
+        for i in range(len(items)):
+            if display_y + i >= inst_y:
                 break
-            
-            prefix = "[ ]"
-            attr = color_mgr.get_color_attr('white') if color_mgr else curses.A_NORMAL
-            
-            if i in selected_indices:
-                prefix = "[X]"
-            
-            if i == current_idx:
-                attr = (color_mgr.get_color_attr('black_on_yellow') | curses.A_BOLD) if color_mgr else curses.A_REVERSE
-            
-            display_text = f"{prefix} {item}"
-            stdscr.addstr(y, start_x, display_text, attr)
-
-        inst_y = max_height - 3
-        if color_mgr:
-            stdscr.addstr(inst_y, start_x, "Use \u2191\u2193 to navigate, SPACE to toggle, ENTER to confirm", color_mgr.get_color_attr('bright_yellow'))
-            stdscr.addstr(inst_y + 1, start_x, f"Selected: {len(selected_indices)}/{max_selections}", color_mgr.get_color_attr('white'))
+            draw_row(i)
         
-        stdscr.refresh()
+        if color_mgr:
+            stdscr.addstr(inst_y, start_x, _INST_MULTI, color_mgr.get_color_attr('bright_yellow'))
+            draw_counter()
         
+        commit(stdscr)
+    
+    # Draw the whole list once; keypresses below only repaint the rows that change
+    max_height = max_width = inst_y = 0
+    draw_all()
+
+    while True:
         key = stdscr.getch()
+        prev_idx = current_idx
+        toggled = False
         
         if key == curses.KEY_UP:
             current_idx = (current_idx - 1) % len(items)
@@ -213,28 +322,90 @@ def get_multi_selection(stdscr, items, min_selections, max_selections, title="",
         elif key == ord(' '):
             if current_idx in selected_indices:
                 selected_indices.remove(current_idx)
+                toggled = True
             else:
                 if len(selected_indices) < max_selections:
                     selected_indices.append(current_idx)
+                    toggled = True
         elif key in [ord('\n'), ord('\r'), curses.KEY_ENTER]:
             if len(selected_indices) >= min_selections:
                 return selected_indices
         elif key == ord('q'):
             return []
+        elif key == curses.KEY_RESIZE:
+            draw_all()
+            continue
+        
+        if current_idx == prev_idx and not toggled:
+            continue
+        
+        for idx in {prev_idx, current_idx}:
+            if display_y + idx < inst_y:
+                stdscr.move(display_y + idx, start_x)
+                stdscr.clrtoeol()
+                draw_row(idx)
+        
+        if toggled and color_mgr:
+            draw_counter()
+        
+        commit(stdscr)
 
 # -------------------------
 # Data classes
 # -------------------------
-@dataclass
+def _status_message_template(move_name: str) -> str:
+    """Battle message for a status move, picked from keywords in its name; filled in with str.format"""
+    name = move_name.lower()
+    if "heal" in name:
+        return "{attacker} recovered HP!"
+    if "defense" in name and "lower" not in name:
+        return "{attacker}'s defense rose!"
+    if "speed" in name:
+        if "boost" in name or "raise" in name:
+            return "{attacker}'s speed rose!"
+        return "{defender}'s speed fell!"
+    if "poison" in name:
+        return "{defender} was poisoned!"
+    if "burn" in name or "fire" in name:
+        return "{defender} was burned!"
+    if "paralyze" in name or "shock" in name or "thunder" in name:
+        return "{defender} was paralyzed!"
+    if "curse" in name:
+        return "{defender}'s defense fell!"
+    if "memory corruption" in name:
+        return "{defender}'s defense was corrupted!"
+    return "{move} took effect!"
+
+@dataclass(slots=True)
 class Move:
     name: str
     power: int
     energy_cost: int
     category: str
     description: str = ""
-    effect: Optional[Callable] = None
+    # (EFFECTS key, extra args, 'atk' | 'def' | 'both' for who the effect is applied to)
+    effect: Optional[Tuple[str, tuple, str]] = None
+    # Message perform_move shows after a status move; worked out once from the name
+    status_msg: str = field(init=False, default="", repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self):
+        self.status_msg = _status_message_template(self.name)
+
+    def run_effect(self, stdscr, color_mgr, atk_p, def_p):
+        """Dispatch this move's effect through the EFFECTS table"""
+        name, args, target = self.effect
+        func = EFFECTS[name]
+        if target == 'both':
+            return func(stdscr, color_mgr, atk_p, def_p, *args)
+        return func(stdscr, color_mgr, atk_p if target == 'atk' else def_p, *args)
+
+@dataclass(slots=True)
+class StatusState:
+    """Turns left on a poison, burn or paralysis, plus its damage per turn"""
+    turns: int
+    dmg: int = 0
+
+@dataclass(slots=True)
 class Pokemon:
     name: str
     lvl: int
@@ -247,15 +418,94 @@ class Pokemon:
     hp: int = field(init=False)
     energy: int = field(init=False)
     status: dict = field(default_factory=dict)
-    ascii_art: List[str] = field(default_factory=list)
+    ascii_art: Tuple[str, ...] = ()
+    # Move indices ordered by energy cost, with the matching sorted costs for bisect
+    _moves_by_cost: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _sorted_costs: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    # Derived from status and rebuilt by status_changed(): atk/dfns with boosts
+    # applied, and the HUD status line and VGC markers (None until next asked for)
+    _atk_eff: int = field(init=False, repr=False, compare=False)
+    _def_eff: int = field(init=False, repr=False, compare=False)
+    _status_text: Optional[str] = field(init=False, default=None, repr=False, compare=False)
+    _status_marks: Optional[str] = field(init=False, default=None, repr=False, compare=False)
 
     def __post_init__(self):
         self.hp = self.max_hp
         self.energy = self.energy_max
+        self.ascii_art = tuple(self.ascii_art)
+        self._moves_by_cost = tuple(sorted(range(len(self.moves)), key=lambda i: self.moves[i].energy_cost))
+        self._sorted_costs = tuple(self.moves[i].energy_cost for i in self._moves_by_cost)
+        self.status_changed()
 
     def alive(self):
         return self.hp > 0
 
+    def status_changed(self):
+        """Rebuild everything derived from status; call after any change to it"""
+        status = self.status
+        self._status_text = None
+        self._status_marks = None
+        self._atk_eff = self.atk
+        if status.get('atk_up', 0) > 0:
+            self._atk_eff += status.get('atk_up_amt', 0)
+        self._def_eff = self.dfns
+        if status.get('def_down', 0) > 0:
+            self._def_eff = max(1, self._def_eff - status.get('def_down_amt', 0))
+        if status.get('def_up', 0) > 0:
+            self._def_eff += status.get('def_up_amt', 0)
+
+    def status_text(self) -> str:
+        """Up to three active statuses joined for the battle HUD, or an empty string"""
+        if self._status_text is None:
+            parts = []
+            for k, v in self.status.items():
+                label = _STATUS_LABELS.get(k)
+                if label is not None:
+                    if v.turns > 0:
+                        parts.append(f"{label}: {v.turns}T")
+                elif not k.endswith('_amt') and v > 0:
+                    parts.append(f"{k.replace('_', ' ').title()}: {v}T")
+            self._status_text = " | ".join(parts[:3])
+        return self._status_text
+
+    def status_marks(self) -> str:
+        """Up to three one-character status markers for a VGC slot"""
+        if self._status_marks is None:
+            status_chars = []
+            for k, v in self.status.items():
+                if isinstance(v, StatusState) and v.turns > 0:
+                    if k == 'poison':
+                        status_chars.append('P')
+                    elif k == 'burn':
+                        status_chars.append('B')
+                    elif k == 'paralysis':
+                        status_chars.append('Z')
+                elif isinstance(v, int) and v > 0:
+                    if 'def_up' in k:
+                        status_chars.append('D')
+                    elif 'atk_up' in k:
+                        status_chars.append('⚔')
+                    elif 'spd_up' in k:
+                        status_chars.append('💨')
+            self._status_marks = ''.join(status_chars[:3])
+        return self._status_marks
+
+    def summary(self) -> str:
+        """Name, level and base stats on one line, as shown in the VGC team preview"""
+        return f"{self.name} Lv{self.lvl} | HP:{self.max_hp} | ATK:{self.atk} | DEF:{self.dfns} | SPD:{self.spd}"
+
+    def affordable_mask(self) -> int:
+        """Bitmask of move indices whose energy cost fits the current energy"""
+        mask = 0
+        for i in self._moves_by_cost[:bisect.bisect_right(self._sorted_costs, self.energy)]:
+            mask |= 1 << i
+        return mask
+
+    def affordable_moves(self) -> List[Move]:
+        """Moves that can be used right now, in move-slot order"""
+        mask = self.affordable_mask()
+        return [move for i, move in enumerate(self.moves) if mask >> i & 1]
+
 # -------------------------
 # Pokemon roster (12+ total)
 # -------------------------
@@ -271,20 +521,20 @@ cbroman = Pokemon(
        Move("Lightning Rush", power=40, energy_cost=81, category="special",
              description="A decisive electric strike."),
        Move("Broman's Curse", power=0, energy_cost=38, category="status",
-             description="Curse: lowers foe's defense.", effect=lambda stdscr, color_mgr, atk_p, def_p: def_lower(stdscr, color_mgr, def_p, 2, 3)),
+             description="Curse: lowers foe's defense.", effect=('def_lower', (2, 3), 'def')),
        Move("Thunder Shock", power=35, energy_cost=59, category="special-status",
-             description="Paralyzing thunder attack.", effect=lambda stdscr, color_mgr, atk_p, def_p: apply_paralysis(stdscr, color_mgr, def_p, 4)),
+             description="Paralyzing thunder attack.", effect=('apply_paralysis', (4,), 'def')),
        Move("Breezing Thunder Shivering", power=80, energy_cost=119, category="mystical-special",
              description="A huge mystical-special thunder blast.")
     ],
-    ascii_art=[
+    ascii_art=(
         r"   ____  ",
         r"  / __ \ ",
         r" | 0\/0 |",
         r" | |--| |",
         r" | |--| |",
         r"  \____/ "
-    ]
+    )
 )
 
 ishowpig = Pokemon(
@@ -305,13 +555,13 @@ ishowpig = Pokemon(
        Move("7 Goals", power=95, energy_cost=131, category="mystical-special",
            description="Powerful mystical goal-blast.")
     ],
-    ascii_art=[
+    ascii_art=(
         r"  (\____/)",
         r"  /  0 0 \ ",
         r" (   *^*  )",
         r"  \  \_/  /",
         r"   \_____/"
-    ]
+    )
 )
 
 emberfox = Pokemon(
@@ -324,19 +574,19 @@ emberfox = Pokemon(
     energy_max=1332,
     moves=[
        Move("Ember Flick", power=90, energy_cost=77, category="special-status",
-           description="Small burst of fire that may burn.", effect=lambda stdscr, color_mgr, atk_p, def_p: apply_burn(stdscr, color_mgr, def_p, 8, 5)),
+           description="Small burst of fire that may burn.", effect=('apply_burn', (8, 5), 'def')),
        Move("Fox Dash", power=18, energy_cost=36, category="physical",
            description="Swift physical lunge."),
        Move("Heat Mirage", power=0, energy_cost=56, category="status",
-           description="Raises speed.", effect=lambda stdscr, color_mgr, atk_p, def_p: speed_boost(stdscr, color_mgr, atk_p, 1, 3)),
+           description="Raises speed.", effect=('speed_boost', (1, 3), 'atk')),
        Move("Flame Nova", power=120, energy_cost=113, category="mystical-special",
            description="Big fire blast.")
     ],
-    ascii_art=[
+    ascii_art=(
         r"   /\_/\ ",
         r"  ( o.o )",
         r"   > ^ < "
-    ]
+    )
 )
 
 shelltron = Pokemon(
@@ -353,16 +603,16 @@ shelltron = Pokemon(
        Move("Aqua Reflex", power=25, energy_cost=44, category="special",
            description="Waterjolt."),
        Move("Fortify", power=0, energy_cost=68, category="status",
-           description="Raises defense.", effect=lambda stdscr, color_mgr, atk_p, def_p: def_boost(stdscr, color_mgr, atk_p, 2, 3)),
+           description="Raises defense.", effect=('def_boost', (2, 3), 'atk')),
        Move("Tidal Crush", power=95, energy_cost=138, category="mystical-special",
-           description="Crushing water wave.",effect= lambda s,c,a,d: deal_percent_max_hp(s,c,d,70))
+           description="Crushing water wave.",effect=('deal_percent_max_hp', (70,), 'def'))
     ],
-    ascii_art=[
+    ascii_art=(
         r"   _____ ",
         r"  / ____\ ",
         r" [| o o |]",
         r"  \_==_/ "
-    ]
+    )
 )
 
 mossgoliath = Pokemon(
@@ -377,19 +627,19 @@ mossgoliath = Pokemon(
        Move("Vine Crack", power=30, energy_cost=83, category="physical",
            description="Ropes of vine attack."),
        Move("Spore Haze", power=0, energy_cost=39, category="status",
-           description="Poison over time.", effect=lambda stdscr, color_mgr, atk_p, def_p: apply_poison(stdscr, color_mgr, def_p, 6, 3)),
+           description="Poison over time.", effect=('apply_poison', (6, 3), 'def')),
        Move("Stone Root", power=45, energy_cost=61, category="special",
            description="Rooted heavy hit."),
        Move("Earth Rend", power=85, energy_cost=123, category="mystical-special",
            description="Massive earth slam.")
     ],
-    ascii_art=[
+    ascii_art=(
         r"   _____ ",
         r"  /     \ ",
         r" |  ^ ^  |",
         r" (  ---  )",
         r"  \_===_/ "
-    ]
+    )
 )
 
 aquabyte = Pokemon(
@@ -406,16 +656,16 @@ aquabyte = Pokemon(
        Move("Data Wave", power=40, energy_cost=37, category="special",
            description="Digital water wave."),
        Move("System Cleanse", power=0, energy_cost=57, category="status",
-           description="Heals small HP.", effect=lambda stdscr, color_mgr, atk_p, def_p: heal(stdscr, color_mgr, atk_p, 40)),
+           description="Heals small HP.", effect=('heal', (40,), 'atk')),
        Move("Cyber Torrent", power=68, energy_cost=115, category="mystical-special",
            description="Cyber-infused tidal wave.")
     ],
-    ascii_art=[
+    ascii_art=(
         r"    .--. ",
         r"  .'_\/_'.",
         r"  '. /\ .'",
         r"    \"\"  "
-    ]
+    )
 )
 
 voltaicor = Pokemon(
@@ -430,19 +680,19 @@ voltaicor = Pokemon(
        Move("Air Slice", power=110, energy_cost=88, category="physical",
            description="A razor-sharp aerial slash."),
        Move("Static Field", power=0, energy_cost=42, category="status",
-           description="Paralyzes foes in an electric field.", effect=lambda s,c,a,d: apply_paralysis(s,c,d,5)),
+           description="Paralyzes foes in an electric field.", effect=('apply_paralysis', (5,), 'def')),
        Move("Bleed Wind", power=90, energy_cost=64, category="special-status",
-           description="Wind that causes bleeding.", effect=lambda s,c,a,d: apply_poison(s,c,d,60,5)),
+           description="Wind that causes bleeding.", effect=('apply_poison', (60, 5), 'def')),
        Move("Sky Verdict", power=210, energy_cost=130, category="mystical-special",
            description="Judgment from the skies.")
     ],
-    ascii_art=[
+    ascii_art=(
         r"   /\\  ",
         r"  /  \\ ",
         r" |    | ",
         r"  \  /  ",
         r"   \/   "
-    ]
+    )
 )
 
 shadowalker = Pokemon(
@@ -457,19 +707,19 @@ shadowalker = Pokemon(
        Move("Shadow Sneak", power=40, energy_cost=84, category="physical",
            description="Attacks from the shadows."),
        Move("Evasion", power=0, energy_cost=40, category="status",
-           description="Raises defense.", effect=lambda stdscr, color_mgr, atk_p, def_p: def_boost(stdscr, color_mgr, atk_p, 2, 3)),
+           description="Raises defense.", effect=('def_boost', (2, 3), 'atk')),
        Move("Night Slash", power=72, energy_cost=61, category="physical",
            description="A slashing attack in the dark."),
        Move("Abyssal Blade", power=95, energy_cost=124, category="mystical-special",
            description="A blade from the abyss.")
     ],
-    ascii_art=[
+    ascii_art=(
         r"   .---.  ",
         r"  /     \ ",
         r" | (o o) |",
         r"  \  ^  / ",
         r"   `---'  "
-    ]
+    )
 )
 
 codezilla = Pokemon(
@@ -482,20 +732,20 @@ codezilla = Pokemon(
     energy_max=1510,
     moves=[
        Move("Syntax Error", power=255, energy_cost=187, category="special",
-           description="A confusing error message.",effect=lambda stdscr, color_mgr, atk_p, def_p: deal_percent_max_hp(stdscr, color_mgr, def_p, 38)),
+           description="A confusing error message.",effect=('deal_percent_max_hp', (38,), 'def')),
        Move("Git Push Force", power=390, energy_cost=141, category="physical",
            description="A forceful push to the repository."),
        Move("Spaghetti Code", power=0, energy_cost=63, category="status",
-           description="Lowers foe's defense.", effect=lambda stdscr, color_mgr, atk_p, def_p: def_lower(stdscr, color_mgr, def_p, 2, 3)),
+           description="Lowers foe's defense.", effect=('def_lower', (2, 3), 'def')),
        Move("Debug Strike", power=35, energy_cost=127, category="physical",
            description="A precise strike to fix a bug.")
     ],
-    ascii_art=[
+    ascii_art=(
         r"    /_\   ",
         r"  <[0_0]> ",
         r"   / \" \  ",
         r"  / / \ \ "
-    ]
+    )
 )
 
 chaddoge = Pokemon(
@@ -510,19 +760,19 @@ chaddoge = Pokemon(
        Move("Much Wow", power=35, energy_cost=80, category="special",
            description="A powerful meme attack."),
        Move("HODL Defense", power=0, energy_cost=38, category="status",
-           description="Raises defense.", effect=lambda stdscr, color_mgr, atk_p, def_p: def_boost(stdscr, color_mgr, atk_p, 2, 3)),
+           description="Raises defense.", effect=('def_boost', (2, 3), 'atk')),
        Move("Moon Rocket", power=540, energy_cost=98, category="mystical-special",
            description="A rocket to the moon."),
        Move("Bork", power=210, energy_cost=118, category="physical",
            description="A simple bark.")
     ],
-    ascii_art=[
+    ascii_art=(
         r"   / \\_  ",
         r"  (    C\___",
         r"  /         @",
         r" /   (_____/",
         r"/_____/   U"
-    ]
+    )
 )
 
 gigapixel = Pokemon(
@@ -541,14 +791,14 @@ gigapixel = Pokemon(
        Move("RGB Split", power=115, energy_cost=66, category="mystical-special",
            description="Splits the foe into RGB colors."),
        Move("Frame Skip", power=0, energy_cost=133, category="status",
-           description="Raises speed.", effect=lambda stdscr, color_mgr, atk_p, def_p: speed_boost(stdscr, color_mgr, atk_p, 1, 3))
+           description="Raises speed.", effect=('speed_boost', (1, 3), 'atk'))
     ],
-    ascii_art=[
+    ascii_art=(
         r"  [\u25a0 \u25a0 \u25a0] ",
         r"  [\u25a0 _ \u25a0] ",
         r"  /[\u25a0\u25a0\u25a0]\ ",
         r"   | | |  "
-    ]
+    )
 )
 
 nullvoid = Pokemon(
@@ -565,15 +815,15 @@ nullvoid = Pokemon(
        Move("Data Leak", power=80, energy_cost=39, category="special",
            description="Leaks the foe's data."),
        Move("Lag Spike", power=0, energy_cost=60, category="status",
-           description="Lowers foe's speed.", effect=lambda stdscr, color_mgr, atk_p, def_p: speed_boost(stdscr, color_mgr, def_p, -1, 3)),
+           description="Lowers foe's speed.", effect=('speed_boost', (-1, 3), 'def')),
        Move("Ping", power=30, energy_cost=121, category="physical",
            description="A simple ping.")
     ],
-    ascii_art=[
+    ascii_art=(
         r"  ?%#@!   ",
         r"  ERROR   ",
         r"  !@#$?   "
-    ],
+    ),
 )
 
 LoraValora = Pokemon(
@@ -588,18 +838,18 @@ LoraValora = Pokemon(
        Move("Valor Strike", power=490, energy_cost=88, category="mystical-special",
            description="A strike filled with valor."),
        Move("Lora's Blessing", power=0, energy_cost=41, category="status",
-           description="Heals a large amount of HP.", effect=lambda stdscr, color_mgr, atk_p, def_p: heal(stdscr, color_mgr, atk_p, 750)),
+           description="Heals a large amount of HP.", effect=('heal', (750,), 'atk')),
        Move("Courageous Roar", power=60, energy_cost=64, category="special",
            description="A roar that boosts morale."),
        Move("Shield of Honor", power=0, energy_cost=129, category="status",
-           description="Raises defense significantly.", effect=lambda stdscr, color_mgr, atk_p, def_p: def_boost(stdscr, color_mgr, atk_p, 108, 18))
+           description="Raises defense significantly.", effect=('def_boost', (108, 18), 'atk'))
     ],
-    ascii_art=[
+    ascii_art=(
         r"   /\ /\   ",
         r"  { O O }  ",
         r"  \  v  /  ",
         r"  '-----'  ",
-    ],
+    ),
 )
 
 SuddyyModa = Pokemon(
@@ -611,12 +861,12 @@ SuddyyModa = Pokemon(
     spd=1358,
     energy_max=1176,
     moves=[
-        Move("KillerStrike", power=380,energy_cost=79, category="special",description="A strike filled with blood",effect=lambda s,c,a,d:deal_percent_max_hp(s,c,d,40)),
+        Move("KillerStrike", power=380,energy_cost=79, category="special",description="A strike filled with blood",effect=('deal_percent_max_hp', (40,), 'def')),
         Move("Bloodlust", power=100, energy_cost=37, category="physical", description="A powerful bloodthirsty attack."),
-        Move("Heal",power=0,energy_cost=58, category="status", description="Heals a large amount of HP.", effect=lambda stdscr, color_mgr, atk_p, def_p: heal(stdscr, color_mgr, atk_p, 100,)),
+        Move("Heal",power=0,energy_cost=58, category="status", description="Heals a large amount of HP.", effect=('heal', (100,), 'atk')),
         Move("KILL",power=400,energy_cost=116,category="mystical-special", description="An attack that ends all life.")
     ],
-    ascii_art=[
+    ascii_art=(
         r"   /\_/\    ",
         r"  ( ^.^ )   ",
         r"  (  -  )   ",
@@ -624,7 +874,7 @@ SuddyyModa = Pokemon(
         r"  /|   |\   ",
         r" (_|___|_)  ",
         r"   /   \    "
-    ]
+    )
 )
 
 GigaCodes = Pokemon(
@@ -637,22 +887,22 @@ GigaCodes = Pokemon(
     energy_max=1284,
     moves=[
        Move("Code Blast", power=290, energy_cost=91, category="special",
-           description="A powerful blast of code.",effect=lambda stdscr, color_mgr, atk_p, def_p: deal_percent_max_hp(stdscr, color_mgr, def_p, 40)),
+           description="A powerful blast of code.",effect=('deal_percent_max_hp', (40,), 'def')),
        Move("Compile Error", power=0, energy_cost=43, category="status",
-           description="Lowers foe's defense.", effect=lambda stdscr, color_mgr, atk_p, def_p: def_lower(stdscr, color_mgr, def_p, 125, 6)),
+           description="Lowers foe's defense.", effect=('def_lower', (125, 6), 'def')),
        Move("Binary Strike", power=190, energy_cost=66, category="physical",
            description="A precise binary attack."),
        Move("Algorithm Overload", power=370, energy_cost=194, category="status-special",
-           description="Overloads the foe with complex algorithms. and heals the user's energy.", effect=lambda stdscr, color_mgr, atk_p, def_p: heal(stdscr, color_mgr, atk_p, 990)),
+           description="Overloads the foe with complex algorithms. and heals the user's energy.", effect=('heal', (990,), 'atk')),
     ],
-    ascii_art=[
+    ascii_art=(
     r"       _-----_       ",
     r"      /  1-0  \      ",
     r" |^|-|  {* *}  |-|^| ",
     r" | | |  ^---^  | | | ",
     r" | | \___0_1___/ | | ",
     r" <->     <->     <-> ",
-    ]
+    )
 )
 
 
@@ -665,19 +915,19 @@ CuteWings = Pokemon(
     spd=1402,
     energy_max=1421,
     moves=[
-        Move("Dusty Waves", power=80,energy_cost=82, category="special",description="it releases dust waves",effect= lambda s,c,a,d: deal_percent_max_hp(s,c,d,25)),
-        Move("Feather Stake",power=50, energy_cost=38, category="status", description="Lowers foe's speed.", effect=lambda stdscr, color_mgr, atk_p, def_p: speed_boost(stdscr, color_mgr, def_p, 132, 4)),
-        Move("Wing Power",power=120,energy_cost=60, category="physical-status", description="A powerful wing attack.",effect=lambda stdscr, color_mgr, atk_p, def_p: apply_poison(stdscr, color_mgr, def_p, 370, 5) ),
-        Move("Will of the Wings",power=230,energy_cost=120,category="mystical-special-status", description="An attack that soars high with the power of wings.",effect=lambda stdscr, color_mgr, atk_p, def_p: def_boost(stdscr, color_mgr,atk_p, 180, 5))
+        Move("Dusty Waves", power=80,energy_cost=82, category="special",description="it releases dust waves",effect=('deal_percent_max_hp', (25,), 'def')),
+        Move("Feather Stake",power=50, energy_cost=38, category="status", description="Lowers foe's speed.", effect=('speed_boost', (132, 4), 'def')),
+        Move("Wing Power",power=120,energy_cost=60, category="physical-status", description="A powerful wing attack.",effect=('apply_poison', (370, 5), 'def')),
+        Move("Will of the Wings",power=230,energy_cost=120,category="mystical-special-status", description="An attack that soars high with the power of wings.",effect=('def_boost', (180, 5), 'atk'))
    
     ],
-    ascii_art=[
+    ascii_art=(
      r"      /\*****/\      ",
      r"     /  0   0  \     ",
      r"  /-|     ^     |-\  ",
      r" /\/\   \___/   /\/\ ",
      r" \|  \_________/  |/ ",
-    ]
+    )
 )
 
 
@@ -690,19 +940,19 @@ Atackker = Pokemon(
     spd=1299,
     energy_max=1317,
     moves=[
-        Move("Attack Mode", power=150, energy_cost=76, category="physical", description="A powerful attack mode.",effect=lambda stdscr, color_mgr, atk_p, def_p: def_boost(stdscr, color_mgr, atk_p, 250,8)),
-        Move("Power Boost", power=200, energy_cost=36, category="status-physical", description="Boosts attack power.", effect=lambda stdscr, color_mgr, atk_p, def_p: atk_boost(stdscr, color_mgr, atk_p, 300, 4)),
-        Move("Energy Drain", power=120, energy_cost=55, category="special-status", description="Drains energy from the foe.",effect= lambda stdscr, color_mgr, atk_p, def_p: heal(stdscr, color_mgr, atk_p, 200)),
-        Move("Final Strike", power=350, energy_cost=111, category="mystical-special", description="A devastating final strike.",effect=lambda stdscr, color_mgr, atk_p, def_p: bonus_damage_if_hp_above(stdscr, color_mgr, atk_p, def_p, 30))
+        Move("Attack Mode", power=150, energy_cost=76, category="physical", description="A powerful attack mode.",effect=('def_boost', (250, 8), 'atk')),
+        Move("Power Boost", power=200, energy_cost=36, category="status-physical", description="Boosts attack power.", effect=('atk_boost', (300, 4), 'atk')),
+        Move("Energy Drain", power=120, energy_cost=55, category="special-status", description="Drains energy from the foe.",effect=('heal', (200,), 'atk')),
+        Move("Final Strike", power=350, energy_cost=111, category="mystical-special", description="A devastating final strike.",effect=('bonus_damage_if_hp_above', (30,), 'both'))
     ],
-    ascii_art=[
+    ascii_art=(
         r"   /-----\   ",
         r"  |  * *  |  ",
         r"  |   -   |  ",
         r" /|_______|\ ",
         r"<_|_O___O_|_>",
         r"  \_______/   "
-    ]
+    )
 )
 
 HexaBreak = Pokemon(
@@ -720,7 +970,7 @@ HexaBreak = Pokemon(
             energy_cost=85,
             category="physical",
             description="A brutal strike that scales with the foe's max HP.",
-            effect=lambda stdscr, color_mgr, atk_p, def_p: deal_percent_max_hp(stdscr, color_mgr, def_p, 36)
+            effect=('deal_percent_max_hp', (36,), 'def')
         ),
         Move(
             "Memory Corruption",
@@ -728,7 +978,7 @@ HexaBreak = Pokemon(
             energy_cost=40,
             category="status-special",
             description="Corrupts memory, lowering foe's defense.",
-            effect=lambda stdscr, color_mgr, atk_p, def_p: def_lower(stdscr, color_mgr, def_p, 42, 4)
+            effect=('def_lower', (42, 4), 'def')
         ),
         Move(
             "ClockCycle Slash",
@@ -736,7 +986,7 @@ HexaBreak = Pokemon(
             energy_cost=62,
             category="physical",
             description="If the user is faster, then the opposition tastes poison!.",
-            effect=lambda stdscr, color_mgr, atk_p, def_p: apply_poison(stdscr, color_mgr, def_p, 120, 7)
+            effect=('apply_poison', (120, 7), 'def')
         ),
         Move(
             "Kernel Panic",
@@ -744,17 +994,17 @@ HexaBreak = Pokemon(
             energy_cost=125,
             category="mystical-special",
             description="Deals massive damage if the foe has high HP.",
-            effect=lambda stdscr, color_mgr, atk_p, def_p: bonus_damage_if_hp_above(stdscr, color_mgr, atk_p, def_p, 20)
+            effect=('bonus_damage_if_hp_above', (20,), 'both')
         )
     ],
-    ascii_art=[
+    ascii_art=(
         r"    /=====\   ",
         r"   |  X  X |  ",
         r"   |  ---  |  ",
         r"  /|_______|\ ",
         r" <_|_0___1_|_>",
         r"   \------/   "
-    ]
+    )
 )
 
 SkyRazor = Pokemon(
@@ -767,21 +1017,21 @@ SkyRazor = Pokemon(
     energy_max=1539,
     moves=[
        Move("Lightning Strike", power=110, energy_cost=88, category="physical-status",
-           description="A shocking aerial slash.", effect=lambda s,c,a,d: apply_paralysis(s,c,d,3)),
+           description="A shocking aerial slash.", effect=('apply_paralysis', (3,), 'def')),
        Move("Pressure Dive", power=0, energy_cost=42, category="status",
-           description="Lowers foe defense.", effect=lambda s,c,a,d: def_lower(s,c,d,40,4)),
+           description="Lowers foe defense.", effect=('def_lower', (40, 4), 'def')),
        Move("Bleed Wind", power=90, energy_cost=64, category="special-status",
-           description="Wind that causes bleeding.", effect=lambda s,c,a,d: apply_poison(s,c,d,60,4)),
+           description="Wind that causes bleeding.", effect=('apply_poison', (60, 4), 'def')),
        Move("Sky Verdict", power=210, energy_cost=130, category="mystical-special",
            description="Judgment from the skies.")
     ],
-    ascii_art=[
+    ascii_art=(
         r"     /\___/\     ",
         r"    (  o   o )   ",
         r"  /-|     ^  |-\ ",
         r"  \_\^^^^^^^^/_/ ",
         r"      /\/\/\     "
-    ]
+    )
 )
 
 BronBull = Pokemon(
@@ -794,15 +1044,15 @@ BronBull = Pokemon(
     energy_max=1180,
     moves=[
         Move("Steel Claw OF the WRATH", power=100, energy_cost=85, category="physical-status",
-             description="Hard metallic Claw.",effect=lambda s,c,a,d: heal(s,c,d, 340)),
+             description="Hard metallic Claw.",effect=('heal', (340,), 'def')),
         Move("Guard Stance", power=0, energy_cost=40, category="status",
-             description="Greatly raises defense.", effect=lambda s,c,a,d: def_boost(s,c,a,90,7)),
+             description="Greatly raises defense.", effect=('def_boost', (90, 7), 'atk')),
         Move("Flaming Breath", power=100, energy_cost=62, category="special-status",
-             description="Fiery breath that burns foes.", effect=lambda s,c,a,d: apply_burn(s,c,d,12,6)),
+             description="Fiery breath that burns foes.", effect=('apply_burn', (12, 6), 'def')),
         Move("Devestating Raid", power=220, energy_cost=125, category="mystical-special-status",
-             description="A devastating metallic storm.",effect=lambda s,c,a,d: deal_percent_max_hp(s,c,d,50))
+             description="A devastating metallic storm.",effect=('deal_percent_max_hp', (50,), 'def'))
     ],
-    ascii_art=[
+    ascii_art=(
     r"   /\  /\    ",
     r"  /--\/--\   ",
     r"  | *__* |   ",
@@ -810,7 +1060,7 @@ BronBull = Pokemon(
     r"  ||V--V||   ",
     r"  |------|   ",
     r"  \******/   "
-    ]
+    )
 )
 
 MetaGross = Pokemon(
@@ -823,18 +1073,18 @@ MetaGross = Pokemon(
     energy_max=1790,
     moves=[
         Move("Meteor mash",power=230, energy_cost=120, category="physical",description="Avg metagross attack"),
-        Move("Bullet Punch",power=180,energy_cost=100,category="physical-status",description="Again a avg atk",effect=lambda s,c,a,d: apply_paralysis(s,c,d,3)),
-        Move("Hyper Beam",power=280,energy_cost=200,category="special-status",description="A power beam",effect=lambda s,c,a,d: apply_burn(s,c,d,90,5)),
-        Move("Zen Headbutt",power=140,energy_cost=100,category="special-physical",description="A powerful psyheatbutt",effect=lambda s,c,a,d: deal_percent_max_hp(s,c,d,45))
+        Move("Bullet Punch",power=180,energy_cost=100,category="physical-status",description="Again a avg atk",effect=('apply_paralysis', (3,), 'def')),
+        Move("Hyper Beam",power=280,energy_cost=200,category="special-status",description="A power beam",effect=('apply_burn', (90, 5), 'def')),
+        Move("Zen Headbutt",power=140,energy_cost=100,category="special-physical",description="A powerful psyheatbutt",effect=('deal_percent_max_hp', (45,), 'def'))
     ],
-    ascii_art=[
+    ascii_art=(
 r"       --------       ", 
 r"  A--/--\\--//--\--A  ",
 r" |^|[ [0]\\//[0] ]|^| ",
 r" [M] \   //\\   / [M] ",
 r" [M]  \_//__\\_/  [M] ",
 r"\[0]/  '-'  '-'  \[0]/"
-    ]
+    )
 
 
 )
@@ -850,32 +1100,62 @@ ROSTER = [cbroman, ishowpig, emberfox, shelltron, mossgoliath, aquabyte,
 # -------------------------
 STATS_FILE = "brokemon_stats.json"
 
+# Last stats dict loaded or saved, and the file mtime it corresponds to
+_STATS_CACHE = None
+_STATS_MTIME = None
+
+def _stats_mtime():
+    try:
+        return os.stat(STATS_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+def _copy_stats(stats):
+    """Copy of a stats dict down to the per-Pokemon records, for callers that run update_stats on it"""
+    return {name: dict(record) for name, record in stats.items()}
+
 def load_stats():
-    """Load statistics from file or create new ones"""
-    if os.path.exists(STATS_FILE):
+    """Load statistics from file or create new ones; reuses the parsed file until it changes"""
+    global _STATS_CACHE, _STATS_MTIME
+    mtime = _stats_mtime()
+    if _STATS_CACHE is not None and mtime == _STATS_MTIME:
+        return _STATS_CACHE
+    
+    stats = None
+    if mtime is not None:
         try:
             with open(STATS_FILE, 'r') as f:
-                return json.load(f)
+                stats = json.loads(f.read())
         except:
             pass
     
-    # Create default stats for all Brokemon
-    default_stats = {}
-    for pokemon in ROSTER:
-        default_stats[pokemon.name] = {
-            "wins": 0,
-            "losses": 0,
-            "matches": 0,
-            "win_percentage": 0.0
-        }
+    if stats is None:
+        # Create default stats for all Brokemon
+        stats = {}
+        for pokemon in ROSTER:
+            stats[pokemon.name] = {
+                "wins": 0,
+                "losses": 0,
+                "matches": 0,
+                "win_percentage": 0.0
+            }
     
-    return default_stats
+    _STATS_CACHE, _STATS_MTIME = stats, mtime
+    return stats
 
 def save_stats(stats):
     """Save statistics to file"""
+    global _STATS_CACHE, _STATS_MTIME
     try:
-        with open(STATS_FILE, 'w') as f:
-            json.dump(stats, f, indent=2)
+        # Serialize up front so the file gets one write instead of one per token
+        data = json.dumps(stats, indent=2)
+        # Write beside the real file and swap it in, so a crash mid-write can't corrupt it
+        tmp = STATS_FILE + ".tmp"
+        with open(tmp, 'w') as f:
+            f.write(data)
+        os.replace(tmp, STATS_FILE)
+        # Only cached once it is on disk, so a failed save can't leak into later loads
+        _STATS_CACHE, _STATS_MTIME = stats, _stats_mtime()
     except Exception as e:
         print(f"Error saving stats: {e}")
 
@@ -895,54 +1175,72 @@ def update_stats(stats, winner_pokemon, loser_pokemon):
     stats[loser_pokemon.name]["losses"] += 1
     stats[loser_pokemon.name]["matches"] += 1
     
-    # Calculate win percentages
-    for pokemon_name in stats:
-        if stats[pokemon_name]["matches"] > 0:
-            stats[pokemon_name]["win_percentage"] = round(
-                (stats[pokemon_name]["wins"] / stats[pokemon_name]["matches"]) * 100, 2
-            )
+    # Only the winner's and loser's records changed, so only their percentages need recomputing
+    for pokemon_name in (winner_pokemon.name, loser_pokemon.name):
+        record = stats[pokemon_name]
+        if record["matches"] > 0:
+            record["win_percentage"] = round((record["wins"] / record["matches"]) * 100, 2)
         else:
-            stats[pokemon_name]["win_percentage"] = 0.0
+            record["win_percentage"] = 0.0
+
+# Column junctions of the stats table rules and header, as offsets from its left edge
+_STATS_TABLE_COLS = (0, 22, 29, 38, 48, 60)
+_STATS_TABLE_WIDTH = _STATS_TABLE_COLS[-1] + 1
+
+# Fixed text of the stats screen
+_STATS_HEADER_ART = (
+    "\u2554\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2557",
+    "\u2551                    [STATS] BROKEMON STATS [STATS]                    \u2551",
+    "\u255a\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u255d",
+)
+_STATS_COL_HEADERS = "  Name                  Wins   Losses   Matches   Win %      "
+_STATS_LEGEND = "Legend: [GREEN] Excellent (70%+) [YELLOW] Good (50-69%) [RED] Poor (1-49%) [WHITE] No battles (0%)"
+_STATS_INSTRUCTIONS = "Press 'r' to refresh | 'q' to return to main menu"
+
+def _draw_table_rule(stdscr, y, x, left, junction, right, attr):
+    """Draw one horizontal rule of the stats table with ACS line-drawing characters"""
+    stdscr.hline(y, x, curses.ACS_HLINE | attr, _STATS_TABLE_WIDTH)
+    stdscr.addch(y, x, left | attr)
+    for col in _STATS_TABLE_COLS[1:-1]:
+        stdscr.addch(y, x + col, junction | attr)
+    stdscr.addch(y, x + _STATS_TABLE_COLS[-1], right | attr)
 
 def display_stats_checker(stdscr, color_mgr):
     """Display beautiful statistics for all Brokemon"""
+    white = color_mgr.get_color_attr('white')
+    stats = load_stats()
+    # Sort stats by win rate (descending) then by name; sorted_mtime is the file version they came from
+    sorted_stats = sorted(stats.items(), key=lambda x: (-x[1]['win_percentage'], x[0]))
+    sorted_mtime = _STATS_MTIME
     while True:
-        stats = load_stats()
-        stdscr.clear()
+        stdscr.erase()
         max_y, max_x = stdscr.getmaxyx()
         
         # Beautiful header
-        header_art = [
-            "\u2554\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2557",
-            "\u2551                    [STATS] BROKEMON STATS [STATS]                    \u2551",
-            "\u255a\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u2550\u255d"
-        ]
-        
         start_y = 2
-        for i, line in enumerate(header_art):
+        for i, line in enumerate(_STATS_HEADER_ART):
             if max_x >= len(line):
                 x_pos = (max_x - len(line)) // 2
                 stdscr.addstr(start_y + i, x_pos, line, color_mgr.get_color_attr('bright_cyan') | curses.A_BOLD)
         
-        # Sort stats by win rate (descending) then by name
-        sorted_stats = sorted(stats.items(), key=lambda x: (-x[1]['win_percentage'], x[0]))
-        
-        y_pos = start_y + len(header_art) + 2
+        y_pos = start_y + len(_STATS_HEADER_ART) + 2
         
         # Column headers
-        header_line = "\u250c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u252c\u2500\u2500\u2500\u2500\u2500\u2500\u252c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u252c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u252c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2510"
-        stdscr.addstr(y_pos, (max_x - len(header_line)) // 2, header_line, color_mgr.get_color_attr('white'))
+        table_x = (max_x - _STATS_TABLE_WIDTH) // 2
+        _draw_table_rule(stdscr, y_pos, table_x, curses.ACS_ULCORNER, curses.ACS_TTEE, curses.ACS_URCORNER, white)
         y_pos += 1
         
-        col_headers = "\u2502 Name                \u2502 Wins \u2502 Losses \u2502 Matches \u2502 Win %     \u2502"
-        stdscr.addstr(y_pos, (max_x - len(col_headers)) // 2, col_headers, color_mgr.get_color_attr('bright_yellow') | curses.A_BOLD)
+        header_attr = color_mgr.get_color_attr('bright_yellow') | curses.A_BOLD
+        stdscr.addstr(y_pos, table_x, _STATS_COL_HEADERS, header_attr)
+        for col in _STATS_TABLE_COLS:
+            stdscr.addch(y_pos, table_x + col, curses.ACS_VLINE | header_attr)
         y_pos += 1
         
-        separator = "\u251c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u253c\u2500\u2500\u2500\u2500\u2500\u2500\u253c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u253c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u253c\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2524"
-        stdscr.addstr(y_pos, (max_x - len(separator)) // 2, separator, color_mgr.get_color_attr('white'))
+        _draw_table_rule(stdscr, y_pos, table_x, curses.ACS_LTEE, curses.ACS_PLUS, curses.ACS_RTEE, white)
         y_pos += 1
         
         # Stats data
+        rows_y = y_pos
         for name, stat in sorted_stats:
             if y_pos >= max_y - 4:  # Leave space for footer
                 break
@@ -957,86 +1255,96 @@ def display_stats_checker(stdscr, color_mgr):
             else:
                 name_color = 'dim_white'
             
-            # Format the line
+            # Format the line; the column bars are drawn once for all rows below
             name_formatted = f"{name[:19]:19}"
-            wins_formatted = f"{stat['wins']:4}"
-            losses_formatted = f"{stat['losses']:6}"
-            matches_formatted = f"{stat['matches']:7}"
             win_rate_formatted = f"{stat['win_percentage']:7.1f}%"
+            line = f"  {name_formatted}   {stat['wins']:4}   {stat['losses']:6}   {stat['matches']:7}   {win_rate_formatted}  "
             
-            line = f"\u2502 {name_formatted} \u2502 {wins_formatted} \u2502 {losses_formatted} \u2502 {matches_formatted} \u2502 {win_rate_formatted} \u2502"
-            
-            x_pos = (max_x - len(line)) // 2
-            
-            # Draw the vertical borders
-            stdscr.addstr(y_pos, x_pos, "\u2502", color_mgr.get_color_attr('white'))
-            stdscr.addstr(y_pos, x_pos + 22, "\u2502", color_mgr.get_color_attr('white'))
-            stdscr.addstr(y_pos, x_pos + 29, "\u2502", color_mgr.get_color_attr('white'))
-            stdscr.addstr(y_pos, x_pos + 38, "\u2502", color_mgr.get_color_attr('white'))
-            stdscr.addstr(y_pos, x_pos + 48, "\u2502", color_mgr.get_color_attr('white'))
-            stdscr.addstr(y_pos, x_pos + 59, "\u2502", color_mgr.get_color_attr('white'))
-            
-            # Draw the actual data with colors
-            stdscr.addstr(y_pos, x_pos + 2, name_formatted, color_mgr.get_color_attr(name_color))
-            stdscr.addstr(y_pos, x_pos + 24, wins_formatted, color_mgr.get_color_attr('white'))
-            stdscr.addstr(y_pos, x_pos + 31, losses_formatted, color_mgr.get_color_attr('white'))
-            stdscr.addstr(y_pos, x_pos + 40, matches_formatted, color_mgr.get_color_attr('white'))
-            stdscr.addstr(y_pos, x_pos + 50, win_rate_formatted, color_mgr.get_color_attr(name_color))
+            # Whole row in white, then recolor the name and win rate
+            name_attr = color_mgr.get_color_attr(name_color)
+            stdscr.addstr(y_pos, table_x, line, white)
+            stdscr.addstr(y_pos, table_x + 2, name_formatted, name_attr)
+            stdscr.addstr(y_pos, table_x + 50, win_rate_formatted, name_attr)
             
             y_pos += 1
         
+        # Vertical borders, one vline per column
+        if y_pos > rows_y:
+            for col in _STATS_TABLE_COLS:
+                stdscr.vline(rows_y, table_x + col, curses.ACS_VLINE | white, y_pos - rows_y)
+        
         # Bottom border
-        bottom_line = "\u2514\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2534\u2500\u2500\u2500\u2500\u2500\u2500\u2534\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2534\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2534\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2500\u2518"
         if y_pos < max_y - 2:
-            stdscr.addstr(y_pos, (max_x - len(bottom_line)) // 2, bottom_line, color_mgr.get_color_attr('white'))
+            _draw_table_rule(stdscr, y_pos, table_x, curses.ACS_LLCORNER, curses.ACS_BTEE, curses.ACS_LRCORNER, white)
             y_pos += 1
         
         # Footer with legend
         y_pos += 1
         if y_pos < max_y - 2:
-            legend = "Legend: [GREEN] Excellent (70%+) [YELLOW] Good (50-69%) [RED] Poor (1-49%) [WHITE] No battles (0%)"
-            stdscr.addstr(y_pos, (max_x - len(legend)) // 2, legend, color_mgr.get_color_attr('bright_cyan'))
+            stdscr.addstr(y_pos, (max_x - len(_STATS_LEGEND)) // 2, _STATS_LEGEND, color_mgr.get_color_attr('bright_cyan'))
         
         y_pos += 1
         if y_pos < max_y - 1:
-            instructions = "Press 'r' to refresh | 'q' to return to main menu"
-            stdscr.addstr(y_pos, (max_x - len(instructions)) // 2, instructions, color_mgr.get_color_attr('bright_yellow'))
+            stdscr.addstr(y_pos, (max_x - len(_STATS_INSTRUCTIONS)) // 2, _STATS_INSTRUCTIONS, color_mgr.get_color_attr('bright_yellow'))
         
-        stdscr.refresh()
+        commit(stdscr)
         
         # Handle input
         key = stdscr.getch()
         if key == ord('q') or key == ord('Q'):
             break
         elif key == ord('r') or key == ord('R'):
-            continue  # Refresh stats
+            # Refresh stats, re-sorting only if the file changed since they were last sorted
+            stats = load_stats()
+            if _STATS_MTIME != sorted_mtime:
+                sorted_stats = sorted(stats.items(), key=lambda x: (-x[1]['win_percentage'], x[0]))
+                sorted_mtime = _STATS_MTIME
+            continue
         else:
             break  # Any other key also exits
 
+# Fixed labels of the match-end screen, with their lengths for centering
+_MATCH_TITLE = "[TROPHY] MATCH COMPLETE [TROPHY]"
+_MATCH_TITLE_LEN = len(_MATCH_TITLE)
+_MATCH_DRAW = "Draw Match!"
+_MATCH_DRAW_LEN = len(_MATCH_DRAW)
+_MATCH_STATS_TITLE = "BROKEMON STATISTICS"
+_MATCH_STATS_TITLE_LEN = len(_MATCH_STATS_TITLE)
+_MATCH_TOP5_TITLE = "Top 5 Brokemon by Win Rate:"
+_MATCH_TOP5_TITLE_LEN = len(_MATCH_TOP5_TITLE)
+_MATCH_CONTINUE = "Press any key to continue..."
+_MATCH_CONTINUE_LEN = len(_MATCH_CONTINUE)
+
 def display_match_stats(stdscr, color_mgr, player1_team, player2_team, winner, player_num):
     """Display statistics at the end of a match"""
-    stdscr.clear()
+    stdscr.erase()
     max_y, max_x = stdscr.getmaxyx()
     
+    def center_fixed(text, text_len, y, attr):
+        # Same clipping as curses_center_text, minus its getmaxyx and len
+        if 0 <= y < max_y:
+            x = max(0, (max_x - text_len) // 2)
+            stdscr.addnstr(y, x, text, max_x - x - 1, attr)
+    
     # Title
-    curses_center_text(stdscr, "[TROPHY] MATCH COMPLETE [TROPHY]", 1, 
-                      color_mgr.get_color_attr('bright_yellow') | curses.A_BOLD)
+    center_fixed(_MATCH_TITLE, _MATCH_TITLE_LEN, 1,
+                 color_mgr.get_color_attr('bright_yellow') | curses.A_BOLD)
     
     # Winner announcement
     if winner:
         curses_center_text(stdscr, f"Player {player_num} Wins with {winner.name}!", 3,
                           color_mgr.get_color_attr('bright_green') | curses.A_BOLD)
     else:
-        curses_center_text(stdscr, "Draw Match!", 3,
-                          color_mgr.get_color_attr('bright_yellow') | curses.A_BOLD)
+        center_fixed(_MATCH_DRAW, _MATCH_DRAW_LEN, 3,
+                     color_mgr.get_color_attr('bright_yellow') | curses.A_BOLD)
         return
     
     # Load current stats
     stats = load_stats()
     
     y_pos = 6
-    curses_center_text(stdscr, "BROKEMON STATISTICS", y_pos,
-                      color_mgr.get_color_attr('bright_cyan') | curses.A_BOLD)
+    center_fixed(_MATCH_STATS_TITLE, _MATCH_STATS_TITLE_LEN, y_pos,
+                 color_mgr.get_color_attr('bright_cyan') | curses.A_BOLD)
     
     y_pos += 2
     curses_center_text(stdscr, f"{winner.name} Statistics:", y_pos,
@@ -1052,11 +1360,11 @@ def display_match_stats(stdscr, color_mgr, player1_team, player2_team, winner, p
                       color_mgr.get_color_attr('bright_green'))
     
     y_pos += 3
-    curses_center_text(stdscr, "Top 5 Brokemon by Win Rate:", y_pos,
-                      color_mgr.get_color_attr('bright_cyan'))
+    center_fixed(_MATCH_TOP5_TITLE, _MATCH_TOP5_TITLE_LEN, y_pos,
+                 color_mgr.get_color_attr('bright_cyan'))
     
-    # Sort by win rate and display top 5
-    sorted_stats = sorted(stats.items(), key=lambda x: x[1]['win_percentage'], reverse=True)[:5]
+    # Pick the top 5 by win rate without sorting the whole table
+    sorted_stats = heapq.nlargest(5, stats.items(), key=lambda x: x[1]['win_percentage'])
     y_pos += 1
     
     for i, (name, stat) in enumerate(sorted_stats):
@@ -1065,51 +1373,67 @@ def display_match_stats(stdscr, color_mgr, player1_team, player2_team, winner, p
             curses_center_text(stdscr, text, y_pos + i, color_mgr.get_color_attr('white'))
     
     y_pos += 6
-    curses_center_text(stdscr, "Press any key to continue...", y_pos,
-                      color_mgr.get_color_attr('bright_yellow'))
+    center_fixed(_MATCH_CONTINUE, _MATCH_CONTINUE_LEN, y_pos,
+                 color_mgr.get_color_attr('bright_yellow'))
     
-    stdscr.refresh()
+    commit(stdscr)
     stdscr.getch()
 
 # -------------------------
 # Effects / status functions
 # -------------------------
+def _bump_status(status, key, turns, amount):
+    """Add turns to a timed status and amount to its matching _amt entry"""
+    status[key] = status.get(key, 0) + turns
+    amt_key = key + '_amt'
+    status[amt_key] = status.get(amt_key, 0) + amount
+
 def def_lower(stdscr, color_mgr, pokemon: Pokemon, amount: int, turns: int):
-    key = 'def_down'
-    pokemon.status[key] = pokemon.status.get(key, 0) + turns
-    pokemon.status.setdefault('def_down_amt', 0)
-    pokemon.status['def_down_amt'] = pokemon.status.get('def_down_amt', 0) + amount
+    _bump_status(pokemon.status, 'def_down', turns, amount)
+    pokemon.status_changed()
 
 def def_boost(stdscr, color_mgr, pokemon: Pokemon, amount: int, turns: int):
-    key = 'def_up'
-    pokemon.status[key] = pokemon.status.get(key, 0) + turns
-    pokemon.status.setdefault('def_up_amt', 0)
-    pokemon.status['def_up_amt'] = pokemon.status.get('def_up_amt', 0) + amount
+    _bump_status(pokemon.status, 'def_up', turns, amount)
+    pokemon.status_changed()
 
 def speed_boost(stdscr, color_mgr, pokemon: Pokemon, amount: int, turns: int):
     if amount > 0:
-        pokemon.status['spd_up'] = pokemon.status.get('spd_up', 0) + turns
-        pokemon.status.setdefault('spd_up_amt', 0)
-        pokemon.status['spd_up_amt'] = pokemon.status.get('spd_up_amt', 0) + amount
+        _bump_status(pokemon.status, 'spd_up', turns, amount)
     else:
-        pokemon.status['spd_down'] = pokemon.status.get('spd_down', 0) + turns
-        pokemon.status.setdefault('spd_down_amt', 0)
-        pokemon.status['spd_down_amt'] = pokemon.status.get('spd_down_amt', 0) + abs(amount)
+        _bump_status(pokemon.status, 'spd_down', turns, abs(amount))
+    pokemon.status_changed()
 
 def atk_boost(stdscr, color_mgr, pokemon: Pokemon, amount: int, turns: int):
-    key = 'atk_up'
-    pokemon.status[key] = pokemon.status.get(key, 0) + turns
-    pokemon.status.setdefault('atk_up_amt', 0)
-    pokemon.status['atk_up_amt'] = pokemon.status.get('atk_up_amt', 0) + amount
+    _bump_status(pokemon.status, 'atk_up', turns, amount)
+    pokemon.status_changed()
+
+class MessageQueue:
+    """Messages raised by effect helpers, shown with the rest of the turn instead of blocking on their own"""
+    __slots__ = ('_items',)
+
+    def __init__(self):
+        self._items = []
+
+    def push(self, text):
+        self._items.append(text)
+
+    def drain(self):
+        items, self._items = self._items, []
+        return items
+
+BATTLE_MESSAGES = MessageQueue()
 
 def apply_poison(stdscr, color_mgr, target: Pokemon, dmg_per_turn: int, turns: int):
-    target.status['poison'] = {'dmg': dmg_per_turn, 'turns': turns}
+    target.status['poison'] = StatusState(turns, dmg_per_turn)
+    target.status_changed()
 
 def apply_paralysis(stdscr, color_mgr, target: Pokemon, turns: int):
-    target.status['paralysis'] = {'turns': turns}
+    target.status['paralysis'] = StatusState(turns)
+    target.status_changed()
 
 def apply_burn(stdscr, color_mgr, target: Pokemon, dmg_per_turn: int, turns: int):
-    target.status['burn'] = {'dmg': dmg_per_turn, 'turns': turns}
+    target.status['burn'] = StatusState(turns, dmg_per_turn)
+    target.status_changed()
 
 def heal(stdscr, color_mgr, pokemon: Pokemon, amount: int):
     old = pokemon.hp
@@ -1121,12 +1445,7 @@ def deal_percent_max_hp(stdscr, color_mgr, target, percent):
     dmg = int(target.max_hp * (percent / 100))
     target.hp = max(0, target.hp - dmg)
 
-    stdscr.addstr(
-        f"\n{target.name} lost {dmg} HP due to HP overflow!",
-        color_mgr.get_color_attr('bright_red')
-    )
-    stdscr.refresh()
-    time.sleep(1.6)
+    BATTLE_MESSAGES.push(f"{target.name} lost {dmg} HP due to HP overflow!")
 
 
 def double_hit_if_faster(stdscr, color_mgr, attacker, defender):
@@ -1145,44 +1464,84 @@ def bonus_damage_if_hp_above(stdscr, color_mgr, attacker, defender, threshold=70
         return 2  # Double damage
     return 1  # Normal damage
 
+EFFECTS = {
+    'def_lower': def_lower,
+    'def_boost': def_boost,
+    'speed_boost': speed_boost,
+    'atk_boost': atk_boost,
+    'apply_poison': apply_poison,
+    'apply_paralysis': apply_paralysis,
+    'apply_burn': apply_burn,
+    'heal': heal,
+    'deal_percent_max_hp': deal_percent_max_hp,
+    'bonus_damage_if_hp_above': bonus_damage_if_hp_above,
+}
+
 # -------------------------
 # Damage formula
 # -------------------------
-def compute_damage(attacker: Pokemon, defender: Pokemon, move: Move) -> Tuple[int, bool]:
+def damage_kernel(atk: int, dfns: int, power: int, lvl_diff: int, variance: float,
+                  _trunc=math.trunc) -> int:
+    """Pre-crit damage from effective stats; plain numbers only so AI code can score moves cheaply"""
+    raw = power * (atk / (dfns if dfns > 1 else 1)) * (1 + lvl_diff * 0.005) * variance
+    return _trunc(raw) if raw > 1 else 1
+
+def compute_damage(attacker: Pokemon, defender: Pokemon, move: Move,
+                   _uniform=_RNG.uniform, _random=_rand, _trunc=math.trunc) -> Tuple[int, bool]:
     base = move.power
     if base <= 0:
         return 0, False
 
-    def_effective = defender.dfns
-    if defender.status.get('def_down', 0) > 0:
-        def_effective = max(1, def_effective - defender.status.get('def_down_amt', 0))
-    if defender.status.get('def_up', 0) > 0:
-        def_effective = def_effective + defender.status.get('def_up_amt', 0)
-
-    atk_effective = attacker.atk
-    if attacker.status.get('atk_up', 0) > 0:
-        atk_effective += attacker.status.get('atk_up_amt', 0)
-
-    ratio = atk_effective / max(1, def_effective)
-    raw = base * ratio
-    raw *= (1 + (attacker.lvl - defender.lvl) * 0.005)
-    variance = random.uniform(0.85, 1.15)
-    dmg = int(max(1, raw * variance))
+    dmg = damage_kernel(attacker._atk_eff, defender._def_eff, base, attacker.lvl - defender.lvl,
+                        _uniform(0.85, 1.15))
     
-    crit = random.random() < 0.07
+    crit = _random() < 0.07
     if crit:
-        dmg = int(dmg * 1.8)
+        dmg = _trunc(dmg * 1.8)
         
     return dmg, crit
 
 # -------------------------
 # COMPLETE BATTLE UI - ALWAYS VISIBLE
 # -------------------------
+# Pads with each sprite pre-drawn, keyed by the art tuple (team clones share it)
+_ART_PADS = {}
+
+def blit_art(stdscr, art, y, x, limit_y, limit_x, attr):
+    """Copy a Pokemon's ASCII art onto the screen from its cached pad, clipped above limit_y/limit_x"""
+    entry = _ART_PADS.get(art)
+    if entry is None:
+        width = max(len(line) for line in art)
+        # One spare column so writing the last cell of a row doesn't raise
+        pad = curses.newpad(len(art), width + 1)
+        for i, line in enumerate(art):
+            pad.addstr(i, 0, line, attr)
+        entry = _ART_PADS[art] = (pad, len(art), width)
+    pad, height, width = entry
+    
+    height = min(height, limit_y - y)
+    width = min(width, limit_x - x)
+    if height > 0 and width > 0 and y >= 0 and x >= 0:
+        pad.overwrite(stdscr, 0, 0, y, x, y + height - 1, x + width - 1)
+
+def battle_hp_row_y(max_y, player_num):
+    """Screen row of a side's HP bar in the draw_battle_ui layout"""
+    return max_y // 2 + 2 if player_num == 1 else 3
+
+def draw_hp_row(stdscr, color_mgr, y, pokemon):
+    """Draw the HP label, bar and count; the count is padded so a shorter number overwrites a longer one"""
+    stdscr.addstr(y, 2, "HP ", color_mgr.get_color_attr('red'))
+    curses_bar(stdscr, y, 5, pokemon.hp, pokemon.max_hp, color_type='hp', color_mgr=color_mgr)
+    hp_text = f"{pokemon.hp}/{pokemon.max_hp}"
+    stdscr.addstr(y, 28, hp_text.ljust(2 * len(str(pokemon.max_hp)) + 1), color_mgr.get_color_attr('white'))
+
 def draw_battle_ui(stdscr, color_mgr, player1_team: List[Pokemon], player2_team: List[Pokemon], 
                    p1_idx=0, p2_idx=0, message="", current_player=1):
     """Draw complete battle UI that's always visible"""
-    stdscr.clear()
+    stdscr.erase()
     max_y, max_x = stdscr.getmaxyx()
+    white = color_mgr.get_color_attr('white')
+    dim_white = color_mgr.get_color_attr('dim_white')
     
     # Draw border
     stdscr.box()
@@ -1197,33 +1556,28 @@ def draw_battle_ui(stdscr, color_mgr, player1_team: List[Pokemon], player2_team:
     # Opponent info at top
     stdscr.addstr(2, 2, "PLAYER 2: ", color_mgr.get_color_attr('bright_magenta'))
     stdscr.addstr(2, 12, f"{opponent.name}", color_mgr.get_color_attr(opponent_color) | curses.A_BOLD)
-    stdscr.addstr(2, 12 + len(opponent.name) + 1, f"LVL:{opponent.lvl}", color_mgr.get_color_attr('dim_white'))
+    stdscr.addstr(2, 12 + len(opponent.name) + 1, f"LVL:{opponent.lvl}", dim_white)
     
     # Opponent HP bar
-    stdscr.addstr(3, 2, "HP ", color_mgr.get_color_attr('red'))
-    curses_bar(stdscr, 3, 5, opponent.hp, opponent.max_hp, color_type='hp', color_mgr=color_mgr)
-    stdscr.addstr(3, 28, f"{opponent.hp}/{opponent.max_hp}", color_mgr.get_color_attr('white'))
+    draw_hp_row(stdscr, color_mgr, battle_hp_row_y(max_y, 2), opponent)
     
     # Opponent Energy bar
     stdscr.addstr(4, 2, "EN ", color_mgr.get_color_attr('cyan'))
     curses_bar(stdscr, 4, 5, opponent.energy, opponent.energy_max, color_type='energy', color_mgr=color_mgr)
-    stdscr.addstr(4, 28, f"{opponent.energy}/{opponent.energy_max}", color_mgr.get_color_attr('white'))
+    stdscr.addstr(4, 28, f"{opponent.energy}/{opponent.energy_max}", white)
     
     # Opponent ASCII art (top right)
     if opponent.ascii_art:
         art_y = 2
         art_x = max_x - 20
-        for i, line in enumerate(opponent.ascii_art):
-            if art_y + i < max_y // 2:
-                stdscr.addstr(art_y + i, art_x, line, color_mgr.get_color_attr('white'))
+        blit_art(stdscr, opponent.ascii_art, art_y, art_x, max_y // 2, max_x - 1, white)
     
     # Separator line
     sep_y = max_y // 2 - 1
-    for x in range(2, max_x - 2):
-        try:
-            stdscr.addch(sep_y, x, '\u2500', color_mgr.get_color_attr('dim_white'))
-        except:
-            pass
+    try:
+        stdscr.addstr(sep_y, 2, '\u2500' * (max_x - 4), dim_white)
+    except curses.error:
+        pass
     
     # Player 1 (BOTTOM - PLAYER)
     player = player1_team[p1_idx]
@@ -1233,62 +1587,41 @@ def draw_battle_ui(stdscr, color_mgr, player1_team: List[Pokemon], player2_team:
     player_y = sep_y + 2
     stdscr.addstr(player_y, 2, "PLAYER 1: ", color_mgr.get_color_attr('bright_blue'))
     stdscr.addstr(player_y, 12, f"{player.name}", color_mgr.get_color_attr(player_color) | curses.A_BOLD)
-    stdscr.addstr(player_y, 12 + len(player.name) + 1, f"LVL:{player.lvl}", color_mgr.get_color_attr('dim_white'))
+    stdscr.addstr(player_y, 12 + len(player.name) + 1, f"LVL:{player.lvl}", dim_white)
     
     # Player HP bar
-    stdscr.addstr(player_y + 1, 2, "HP ", color_mgr.get_color_attr('red'))
-    curses_bar(stdscr, player_y + 1, 5, player.hp, player.max_hp, color_type='hp', color_mgr=color_mgr)
-    stdscr.addstr(player_y + 1, 28, f"{player.hp}/{player.max_hp}", color_mgr.get_color_attr('white'))
+    draw_hp_row(stdscr, color_mgr, battle_hp_row_y(max_y, 1), player)
     
     # Player Energy bar
     stdscr.addstr(player_y + 2, 2, "EN ", color_mgr.get_color_attr('cyan'))
     curses_bar(stdscr, player_y + 2, 5, player.energy, player.energy_max, color_type='energy', color_mgr=color_mgr)
-    stdscr.addstr(player_y + 2, 28, f"{player.energy}/{player.energy_max}", color_mgr.get_color_attr('white'))
+    stdscr.addstr(player_y + 2, 28, f"{player.energy}/{player.energy_max}", white)
     
     # Player ASCII art (bottom right)
     if player.ascii_art:
         art_y = player_y
         art_x = max_x - 20
-        for i, line in enumerate(player.ascii_art):
-            if art_y + i < max_y - 2:
-                stdscr.addstr(art_y + i, art_x, line, color_mgr.get_color_attr('white'))
+        blit_art(stdscr, player.ascii_art, art_y, art_x, max_y - 2, max_x - 1, white)
     
     # Status effects
     if player.status:
         status_y = player_y + 4
-        status_text = []
-        for k, v in player.status.items():
-            if not k.endswith('_amt') and isinstance(v, int) and v > 0:
-                status_text.append(f"{k.replace('_', ' ').title()}: {v}T")
-            elif k == 'poison' and isinstance(v, dict) and v.get('turns', 0) > 0:
-                status_text.append(f"Poison: {v['turns']}T")
-            elif k == 'burn' and isinstance(v, dict) and v.get('turns', 0) > 0:
-                status_text.append(f"Burn: {v['turns']}T")
-            elif k == 'paralysis' and isinstance(v, dict) and v.get('turns', 0) > 0:
-                status_text.append(f"Paralysis: {v['turns']}T")
+        status_text = player.status_text()
         if status_text and status_y < max_y - 2:
-            stdscr.addstr(status_y, 2, "Status: " + " | ".join(status_text[:3]), color_mgr.get_color_attr('yellow'))
+            stdscr.addstr(status_y, 2, "Status: " + status_text, color_mgr.get_color_attr('yellow'))
     
     if opponent.status:
         status_y = 6
-        status_text = []
-        for k, v in opponent.status.items():
-            if not k.endswith('_amt') and isinstance(v, int) and v > 0:
-                status_text.append(f"{k.replace('_', ' ').title()}: {v}T")
-            elif k == 'poison' and isinstance(v, dict) and v.get('turns', 0) > 0:
-                status_text.append(f"Poison: {v['turns']}T")
-            elif k == 'burn' and isinstance(v, dict) and v.get('turns', 0) > 0:
-                status_text.append(f"Burn: {v['turns']}T")
-            elif k == 'paralysis' and isinstance(v, dict) and v.get('turns', 0) > 0:
-                status_text.append(f"Paralysis: {v['turns']}T")
+        status_text = opponent.status_text()
         if status_text:
-            stdscr.addstr(status_y, 2, "Status: " + " | ".join(status_text[:3]), color_mgr.get_color_attr('yellow'))
+            stdscr.addstr(status_y, 2, "Status: " + status_text, color_mgr.get_color_attr('yellow'))
     
     # Battle message area
     if message:
         msg_y = sep_y - 2
         if msg_y > 6:  # Make sure we don't overlap with opponent status
-            msg_lines = message.split('\n')
+            # Battle loops pass perform_move's message list as is; plain strings are split on newlines
+            msg_lines = message.split('\n') if isinstance(message, str) else message
             for i, line in enumerate(msg_lines[:3]):  # Show max 3 lines
                 if msg_y - i >= 7:
                     stdscr.addstr(msg_y - i, 2, line[:max_x - 4], color_mgr.get_color_attr('bright_yellow'))
@@ -1304,8 +1637,6 @@ def draw_battle_ui(stdscr, color_mgr, player1_team: List[Pokemon], player2_team:
         turn_x = max_x - len(turn_text) - 2
         turn_y = 1
         stdscr.addstr(turn_y, turn_x, turn_text, color_mgr.get_color_attr('bright_magenta') | curses.A_BOLD)
-    
-    stdscr.refresh()
 
 # -------------------------
 # Battle System for 2-PLAYER PVP
@@ -1318,7 +1649,7 @@ def get_player_action(stdscr, color_mgr, player_team, opponent_team,
     
     # Show action menu
     actions = ["Attack", "Pass"]
-    if can_switch and len([p for p in player_team if p.alive()]) > 1:
+    if can_switch:
         actions.insert(1, "Switch Pokemon")
     
     menu_y = max_y - len(actions) - 4
@@ -1335,6 +1666,7 @@ def get_player_action(stdscr, color_mgr, player_team, opponent_team,
         # Instructions
         stdscr.addstr(max_y - 2, 2, "\u2191\u2193: Navigate  ENTER: Select", color_mgr.get_color_attr('dim_white'))
         
+        commit(stdscr)
         key = stdscr.getch()
         
         if key == curses.KEY_UP:
@@ -1380,6 +1712,7 @@ def get_player_action(stdscr, color_mgr, player_team, opponent_team,
                     stdscr.addstr(max_y - 2, 2, "\u2191\u2193: Navigate  ENTER: Select  q: Back", 
                                  color_mgr.get_color_attr('dim_white'))
                     
+                    commit(stdscr)
                     key = stdscr.getch()
                     
                     if key == curses.KEY_UP:
@@ -1395,7 +1728,7 @@ def get_player_action(stdscr, color_mgr, player_team, opponent_team,
                             draw_battle_ui(stdscr, color_mgr, player_team, opponent_team, 
                                           player_idx, opponent_idx, 
                                           "Invalid move! Please select a valid move.", current_player)
-                            stdscr.refresh()
+                            commit(stdscr)
                             time.sleep(1)
                     elif key == ord('q'):
                         break
@@ -1423,6 +1756,7 @@ def get_player_action(stdscr, color_mgr, player_team, opponent_team,
                     stdscr.addstr(max_y - 2, 2, "\u2191\u2193: Navigate  ENTER: Select  q: Back", 
                                  color_mgr.get_color_attr('dim_white'))
                     
+                    commit(stdscr)
                     key = stdscr.getch()
                     
                     if key == curses.KEY_UP:
@@ -1441,47 +1775,33 @@ def get_player_action(stdscr, color_mgr, player_team, opponent_team,
         elif key == ord('q'):
             return "pass", None, player_idx
 
+# Per animation state: the art's color and how each line is altered
+_ASCII_ANIMATIONS = {
+    "damage": ('bright_red', lambda line: line.replace('O', 'X').replace('0', 'x').replace('@', '#')),
+    "heal": ('bright_green', lambda line: line + " +"),
+    "attack": ('bright_yellow', lambda line: "!" + line),
+}
+
 def animate_ascii_pokemon(stdscr, color_mgr, pokemon: Pokemon, x: int, y: int, animation_type="idle"):
     """Animate ASCII Pokemon with different states"""
     if not pokemon.ascii_art:
         return
     
-    # Apply animation effects based on type
-    animated_art = []
-    for line in pokemon.ascii_art:
-        if animation_type == "damage":
-            # Replace some characters with damage indicators
-            animated_line = line.replace('O', 'X').replace('0', 'x').replace('@', '#')
-        elif animation_type == "heal":
-            # Add healing sparkles
-            animated_line = line + " +"
-        elif animation_type == "attack":
-            # Add attack effect
-            animated_line = "!" + line
-        else:
-            animated_line = line
-        
-        animated_art.append(animated_line)
-    
-    # Display the animated art
-    for i, line in enumerate(animated_art):
-        # Choose color based on animation
-        if animation_type == "damage":
-            color_attr = color_mgr.get_color_attr('bright_red')
-        elif animation_type == "heal":
-            color_attr = color_mgr.get_color_attr('bright_green')
-        elif animation_type == "attack":
-            color_attr = color_mgr.get_color_attr('bright_yellow')
-        else:
-            color_attr = color_mgr.get_color_attr('white')
-        
+    # One color lookup per call; idle art is drawn as-is
+    color_name, transform = _ASCII_ANIMATIONS.get(animation_type, ('white', None))
+    color_attr = color_mgr.get_color_attr(color_name)
+    for i, line in enumerate(pokemon.ascii_art):
         try:
-            stdscr.addstr(y + i, x, line, color_attr)
+            stdscr.addstr(y + i, x, transform(line) if transform else line, color_attr)
         except curses.error:
             pass
 
 def animate_hp_drain(stdscr, color_mgr, p1_team, p2_team, p1_idx, p2_idx, target_pokemon, damage, current_player, message):
     """Animates the HP bar draining with a more realistic effect."""
+    if HEADLESS:
+        target_pokemon.hp = max(0, target_pokemon.hp - damage)
+        return
+    
     start_hp = target_pokemon.hp
     end_hp = max(0, start_hp - damage)
     hp_lost = start_hp - end_hp
@@ -1489,35 +1809,49 @@ def animate_hp_drain(stdscr, color_mgr, p1_team, p2_team, p1_idx, p2_idx, target
     if hp_lost <= 0:
         # If there's no HP to lose, just show the message and return
         draw_battle_ui(stdscr, color_mgr, p1_team, p2_team, p1_idx, p2_idx, message, current_player)
-        stdscr.refresh()
+        commit(stdscr)
         time.sleep(1)
         return
     
     duration = 0.7
     frames = 40
-    interval = duration / frames
+    clock = FrameClock(fps=frames / duration)
+    
+    # Nothing but the target's HP row changes while it drains, so draw the
+    # full UI once and then repaint only that row when the shown HP moves
+    draw_battle_ui(stdscr, color_mgr, p1_team, p2_team, p1_idx, p2_idx, message, current_player)
+    commit(stdscr)
+    max_y, max_x = stdscr.getmaxyx()
+    if target_pokemon is p1_team[p1_idx]:
+        target_y = battle_hp_row_y(max_y, 1)
+    elif target_pokemon is p2_team[p2_idx]:
+        target_y = battle_hp_row_y(max_y, 2)
+    else:
+        target_y = None  # Target isn't on screen, so no frame would look any different
+    drawn_hp = start_hp
 
-    for i in range(frames + 1):
-        progress = i / frames
-        ease_progress = 1 - (1 - progress) ** 2
-        
-        current_drain = int(hp_lost * ease_progress)
-        display_hp = start_hp - current_drain
-        
-        # Ensure HP doesn't go below the calculated end_hp
-        target_pokemon.hp = max(end_hp, display_hp)
+    # Ease-out schedule of the HP shown each frame, never dipping below end_hp
+    hp_schedule = [max(end_hp, start_hp - int(hp_lost * (1 - (1 - i / frames) ** 2)))
+                   for i in range(frames + 1)]
+    behind = clock.behind
+    tick = clock.tick
+
+    for hp in hp_schedule:
+        target_pokemon.hp = hp
         
-        # Redraw the UI in each frame
-        draw_battle_ui(stdscr, color_mgr, p1_team, p2_team, p1_idx, p2_idx, message, current_player)
-        stdscr.refresh()
-        time.sleep(interval)
+        # Frames that are already late are dropped so slow terminals don't stretch the animation
+        if target_y is not None and hp != drawn_hp and not behind():
+            draw_hp_row(stdscr, color_mgr, target_y, target_pokemon)
+            drawn_hp = hp
+            commit(stdscr)
+        tick()
 
     # Ensure final state is accurate
     target_pokemon.hp = end_hp
     draw_battle_ui(stdscr, color_mgr, p1_team, p2_team, p1_idx, p2_idx, message, current_player)
     
     curses.beep()
-    stdscr.refresh()
+    commit(stdscr)
     time.sleep(0.3)
 
 def perform_move(stdscr, color_mgr, attacker: Pokemon, defender: Pokemon, move: Move, p1_team, p2_team, p1_idx, p2_idx, current_player):
@@ -1526,8 +1860,8 @@ def perform_move(stdscr, color_mgr, attacker: Pokemon, defender: Pokemon, move:
     
     # Check paralysis
     paralysis = attacker.status.get('paralysis')
-    if paralysis and isinstance(paralysis, dict) and paralysis.get('turns', 0) > 0:
-        if random.random() < 0.25:  # 25% chance to be fully paralyzed
+    if paralysis and paralysis.turns > 0:
+        if _rand() < 0.25:  # 25% chance to be fully paralyzed
             messages.append(f"{attacker.name} is fully paralyzed!")
             return messages
     
@@ -1543,7 +1877,7 @@ def perform_move(stdscr, color_mgr, attacker: Pokemon, defender: Pokemon, move:
         # Apply status effect
         if move.effect:
             try:
-                result = move.effect(stdscr, color_mgr, attacker, defender)
+                result = move.run_effect(stdscr, color_mgr, attacker, defender)
                 # Handle HexaBreak special effects that return tuples
                 if result and isinstance(result, tuple):
                     effect_type = result[0]
@@ -1563,30 +1897,11 @@ def perform_move(stdscr, color_mgr, attacker: Pokemon, defender: Pokemon, move:
                     pass
             except:
                 # Fallback for original lambda functions
-                move.effect(stdscr, color_mgr, attacker, defender)
-        
-        # Add appropriate message based on move
-        if "heal" in move.name.lower():
-            messages.append(f"{attacker.name} recovered HP!")
-        elif "defense" in move.name.lower() and "lower" not in move.name.lower():
-            messages.append(f"{attacker.name}'s defense rose!")
-        elif "speed" in move.name.lower():
-            if "boost" in move.name.lower() or "raise" in move.name.lower():
-                messages.append(f"{attacker.name}'s speed rose!")
-            else:
-                messages.append(f"{defender.name}'s speed fell!")
-        elif "poison" in move.name.lower():
-            messages.append(f"{defender.name} was poisoned!")
-        elif "burn" in move.name.lower() or "fire" in move.name.lower():
-            messages.append(f"{defender.name} was burned!")
-        elif "paralyze" in move.name.lower() or "shock" in move.name.lower() or "thunder" in move.name.lower():
-            messages.append(f"{defender.name} was paralyzed!")
-        elif "curse" in move.name.lower():
-            messages.append(f"{defender.name}'s defense fell!")
-        elif "memory corruption" in move.name.lower():
-            messages.append(f"{defender.name}'s defense was corrupted!")
-        else:
-            messages.append(f"{move.name} took effect!")
+                move.run_effect(stdscr, color_mgr, attacker, defender)
+            messages.extend(BATTLE_MESSAGES.drain())
+        
+        # Add the move's precomputed message
+        messages.append(move.status_msg.format(attacker=attacker.name, defender=defender.name, move=move.name))
     else:
         # Calculate and apply damage
         dmg, crit = compute_damage(attacker, defender, move)
@@ -1594,7 +1909,7 @@ def perform_move(stdscr, color_mgr, attacker: Pokemon, defender: Pokemon, move:
         # Apply special effects for damage moves
         if move.effect:
             try:
-                result = move.effect(stdscr, color_mgr, attacker, defender)
+                result = move.run_effect(stdscr, color_mgr, attacker, defender)
                 # Handle HexaBreak special effects that return tuples
                 if result and isinstance(result, tuple):
                     effect_type = result[0]
@@ -1622,6 +1937,7 @@ def perform_move(stdscr, color_mgr, attacker: Pokemon, defender: Pokemon, move:
             except:
                 # Fallback for original lambda functions
                 pass
+            messages.extend(BATTLE_MESSAGES.drain())
         
         # Apply the calculated damage
         if dmg > 0:
@@ -1641,46 +1957,48 @@ def perform_move(stdscr, color_mgr, attacker: Pokemon, defender: Pokemon, move:
     
     return messages
 
+# HUD labels for the StatusState-valued statuses
+_STATUS_LABELS = {'poison': 'Poison', 'burn': 'Burn', 'paralysis': 'Paralysis'}
+# Damage-over-time statuses, stored as StatusState
+_DOT_STATUSES = ('poison', 'burn')
+# Int turn-counter statuses set by _bump_status, each paired with its _amt key
+_TIMED_STATUSES = tuple((key, key + '_amt') for key in ('atk_up', 'def_down', 'def_up', 'spd_up', 'spd_down'))
+
 def apply_end_of_turn(stdscr, color_mgr, poke: Pokemon):
     """Apply end of turn status effects"""
     if not poke.alive():
         return
     
-    # Apply poison damage
-    poison = poke.status.get('poison')
-    if poison and isinstance(poison, dict) and poison.get('turns', 0) > 0:
-        dmg = poison.get('dmg', 0)
-        poke.hp = max(0, poke.hp - dmg)
-        poison['turns'] -= 1
-        if poison['turns'] <= 0:
-            poke.status.pop('poison', None)
-    
-    # Apply burn damage
-    burn = poke.status.get('burn')
-    if burn and isinstance(burn, dict) and burn.get('turns', 0) > 0:
-        dmg = burn.get('dmg', 0)
-        poke.hp = max(0, poke.hp - dmg)
-        burn['turns'] -= 1
-        if burn['turns'] <= 0:
-            poke.status.pop('burn', None)
+    status = poke.status
+    
+    # Apply poison and burn damage
+    for name in _DOT_STATUSES:
+        effect = status.get(name)
+        if effect and effect.turns > 0:
+            poke.hp = max(0, poke.hp - effect.dmg)
+            effect.turns -= 1
+            if effect.turns <= 0:
+                del status[name]
     
     # Decrement status durations
-    for key in list(poke.status.keys()):
-        if key.endswith('_amt') or key in ['poison', 'burn', 'paralysis']:
+    for key, amt_key in _TIMED_STATUSES:
+        turns = status.get(key)
+        if turns is None:
             continue
-
-        if key in poke.status and isinstance(poke.status.get(key), int):
-            poke.status[key] -= 1
-            if poke.status[key] <= 0:
-                poke.status.pop(key, None)
-                poke.status.pop(f"{key}_amt", None)
+        if turns <= 1:
+            del status[key]
+            status.pop(amt_key, None)
+        else:
+            status[key] = turns - 1
     
     # Handle paralysis duration
-    paralysis = poke.status.get('paralysis')
-    if paralysis and isinstance(paralysis, dict) and paralysis.get('turns', 0) > 0:
-        paralysis['turns'] -= 1
-        if paralysis['turns'] <= 0:
-            poke.status.pop('paralysis', None)
+    paralysis = status.get('paralysis')
+    if paralysis and paralysis.turns > 0:
+        paralysis.turns -= 1
+        if paralysis.turns <= 0:
+            del status['paralysis']
+    
+    poke.status_changed()
 
 def prompt_switch(stdscr, color_mgr, team, player_name, player_color_name):
     """Prompt a player to switch Pok\u00e9mon"""
@@ -1695,12 +2013,7 @@ def prompt_switch(stdscr, color_mgr, team, player_name, player_color_name):
     curses_center_text(stdscr, f"{player_name}, choose your next Pok\u00e9mon!", 0, 
                       color_mgr.get_color_attr(player_color_name))
     
-    menu_items = []
-    for idx in options:
-        p = team[idx]
-        hp_percent = p.hp / p.max_hp
-        hp_color = 'green' if hp_percent > 0.5 else 'yellow' if hp_percent > 0.25 else 'red'
-        menu_items.append(f"{p.name} (HP: {p.hp}/{p.max_hp})")
+    menu_items = [f"{team[idx].name} (HP: {team[idx].hp}/{team[idx].max_hp})" for idx in options]
     
     selected_idx = get_menu_selection(stdscr, menu_items, 
                                      title="Available Pok\u00e9mon:", 
@@ -1711,142 +2024,98 @@ def prompt_switch(stdscr, color_mgr, team, player_name, player_color_name):
     
     return options[selected_idx]
 
+def _alive_change(pokemon, was_alive):
+    """-1 if the Pokemon went down since was_alive was read, 1 if a heal brought it back up, else 0"""
+    return pokemon.alive() - was_alive
+
+# Switch-prompt color of each pvp side
+_PVP_COLORS = ('bright_blue', 'bright_magenta')
+
+def _pvp_half_turn(stdscr, color_mgr, teams, idx, alive, side):
+    """Play one player's half of a pvp turn, updating idx and alive in place; False once the battle ends"""
+    other = 1 - side
+    player_num, other_num = side + 1, other + 1
+    actor_team, target_team = teams[side], teams[other]
+    
+    def show(message, current_player, seconds):
+        draw_battle_ui(stdscr, color_mgr, teams[0], teams[1], 
+                      idx[0], idx[1], message, current_player=current_player)
+        commit(stdscr)
+        wait_or_skip(stdscr, seconds)
+    
+    # Check if this player's Pok\u00e9mon is alive
+    if not actor_team[idx[side]].alive():
+        new_idx = prompt_switch(stdscr, color_mgr, actor_team, f"Player {player_num}", _PVP_COLORS[side])
+        if new_idx is None:
+            return False
+        idx[side] = new_idx
+    actor = actor_team[idx[side]]
+    target = target_team[idx[other]]
+    
+    # This player's action
+    action, move, idx[side] = get_player_action(stdscr, color_mgr, 
+                                                actor_team, target_team,
+                                                idx[side], idx[other], player_num, alive[side] > 1)
+    
+    # Execute it
+    if action == "attack" and move:
+        actor_was_alive, target_was_alive = actor.alive(), target.alive()
+        messages = perform_move(stdscr, color_mgr, actor, target, move, teams[0], teams[1], idx[0], idx[1], player_num)
+        alive[side] += _alive_change(actor, actor_was_alive)
+        alive[other] += _alive_change(target, target_was_alive)
+        show(messages, player_num, 2)
+        
+    elif action == "switch":
+        actor = actor_team[idx[side]]
+        actor.energy = min(actor.energy_max, actor.energy + 8)
+        show(f"Player {player_num} switched to {actor.name}!", player_num, 1.5)
+        
+    elif action == "pass":
+        actor.energy = min(actor.energy_max, actor.energy + 5)
+        show(f"{actor.name} passes and regains energy!", player_num, 1)
+    
+    # Check if the other player's Pok\u00e9mon fainted
+    if not target_team[idx[other]].alive():
+        if not alive[other]:
+            return False
+        
+        show(f"{target_team[idx[other]].name} fainted! Player {other_num}, choose your next Pok\u00e9mon.", other_num, 2)
+        
+        new_idx = prompt_switch(stdscr, color_mgr, target_team, f"Player {other_num}", _PVP_COLORS[other])
+        if new_idx is None:
+            return False
+        idx[other] = new_idx
+    
+    return True
+
 def battle_pvp(stdscr, player1_team: List[Pokemon], player2_team: List[Pokemon], color_mgr):
     """Main 2-player battle loop"""
-    p1_idx, p2_idx = 0, 0
+    teams = (player1_team, player2_team)
+    idx = [0, 0]
+    # Only the two active Pokemon ever change HP, so faints (and heals that bring
+    # one back up) are counted off them instead of rescanning both teams
+    alive = [sum(1 for p in team if p.alive()) for team in teams]
     
     # Initial display
     draw_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
-                  p1_idx, p2_idx, "Battle Start! Player 1 goes first.", current_player=1)
-    stdscr.refresh()
-    time.sleep(2)
+                  idx[0], idx[1], "Battle Start! Player 1 goes first.", current_player=1)
+    commit(stdscr)
+    wait_or_skip(stdscr, 2)
     
-    while any(p.alive() for p in player1_team) and any(p.alive() for p in player2_team):
-        # Player 1's turn
-        player1 = player1_team[p1_idx]
-        player2 = player2_team[p2_idx]
-        
-        # Check if Player 1's Pok\u00e9mon is alive
-        if not player1.alive():
-            p1_idx = prompt_switch(stdscr, color_mgr, player1_team, "Player 1", 'bright_blue')
-            if p1_idx is None:
-                break
-            player1 = player1_team[p1_idx]
-        
-        # Player 1's action
-        can_switch = len([p for p in player1_team if p.alive()]) > 1
-        p1_action, p1_move, p1_idx = get_player_action(stdscr, color_mgr, 
-                                                      player1_team, player2_team,
-                                                      p1_idx, p2_idx, 1, can_switch)
-        
-        # Execute Player 1's action
-        if p1_action == "attack" and p1_move:
-            messages = perform_move(stdscr, color_mgr, player1, player2, p1_move, player1_team, player2_team, p1_idx, p2_idx, 1)
-            message = "\n".join(messages)
-            draw_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
-                          p1_idx, p2_idx, message, current_player=1)
-            stdscr.refresh()
-            time.sleep(2)
-            
-        elif p1_action == "switch":
-            message = f"Player 1 switched to {player1_team[p1_idx].name}!"
-            player1_team[p1_idx].energy = min(player1_team[p1_idx].energy_max, 
-                                             player1_team[p1_idx].energy + 8)
-            draw_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
-                          p1_idx, p2_idx, message, current_player=1)
-            stdscr.refresh()
-            time.sleep(1.5)
-            
-        elif p1_action == "pass":
-            player1.energy = min(player1.energy_max, player1.energy + 5)
-            message = f"{player1.name} passes and regains energy!"
-            draw_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
-                          p1_idx, p2_idx, message, current_player=1)
-            stdscr.refresh()
-            time.sleep(1)
-        
-        # Check if Player 2 fainted
-        if not player2_team[p2_idx].alive():
-            if not any(p.alive() for p in player2_team):
-                break
-            
-            message = f"{player2_team[p2_idx].name} fainted! Player 2, choose your next Pok\u00e9mon."
-            draw_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
-                          p1_idx, p2_idx, message, current_player=2)
-            stdscr.refresh()
-            time.sleep(2)
-            
-            p2_idx = prompt_switch(stdscr, color_mgr, player2_team, "Player 2", 'bright_magenta')
-            if p2_idx is None:
-                break
-        
-        # Player 2's turn
-        player1 = player1_team[p1_idx]
-        player2 = player2_team[p2_idx]
-        
-        # Check if Player 2's Pok\u00e9mon is alive
-        if not player2.alive():
-            p2_idx = prompt_switch(stdscr, color_mgr, player2_team, "Player 2", 'bright_magenta')
-            if p2_idx is None:
-                break
-            player2 = player2_team[p2_idx]
-        
-        # Player 2's action
-        can_switch = len([p for p in player2_team if p.alive()]) > 1
-        p2_action, p2_move, p2_idx = get_player_action(stdscr, color_mgr, 
-                                                      player2_team, player1_team,
-                                                      p2_idx, p1_idx, 2, can_switch)
-        
-        # Execute Player 2's action
-        if p2_action == "attack" and p2_move:
-            messages = perform_move(stdscr, color_mgr, player2, player1, p2_move, player1_team, player2_team, p1_idx, p2_idx, 2)
-            message = "\n".join(messages)
-            draw_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
-                          p1_idx, p2_idx, message, current_player=2)
-            stdscr.refresh()
-            time.sleep(2)
-            
-        elif p2_action == "switch":
-            message = f"Player 2 switched to {player2_team[p2_idx].name}!"
-            player2_team[p2_idx].energy = min(player2_team[p2_idx].energy_max, 
-                                             player2_team[p2_idx].energy + 8)
-            draw_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
-                          p1_idx, p2_idx, message, current_player=2)
-            stdscr.refresh()
-            time.sleep(1.5)
-            
-        elif p2_action == "pass":
-            player2.energy = min(player2.energy_max, player2.energy + 5)
-            message = f"{player2.name} passes and regains energy!"
-            draw_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
-                          p1_idx, p2_idx, message, current_player=2)
-            stdscr.refresh()
-            time.sleep(1)
-        
-        # Check if Player 1 fainted
-        if not player1_team[p1_idx].alive():
-            if not any(p.alive() for p in player1_team):
-                break
-            
-            message = f"{player1_team[p1_idx].name} fainted! Player 1, choose your next Pok\u00e9mon."
-            draw_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
-                          p1_idx, p2_idx, message, current_player=1)
-            stdscr.refresh()
-            time.sleep(2)
-            
-            p1_idx = prompt_switch(stdscr, color_mgr, player1_team, "Player 1", 'bright_blue')
-            if p1_idx is None:
-                break
-        
-        # Apply end of turn effects
-        apply_end_of_turn(stdscr, color_mgr, player1_team[p1_idx])
-        apply_end_of_turn(stdscr, color_mgr, player2_team[p2_idx])
+    while alive[0] and alive[1]:
+        # Player 1's turn, then Player 2's
+        if not _pvp_half_turn(stdscr, color_mgr, teams, idx, alive, 0):
+            break
+        if not _pvp_half_turn(stdscr, color_mgr, teams, idx, alive, 1):
+            break
         
-        # Regen energy for both
-        player1_team[p1_idx].energy = min(player1_team[p1_idx].energy_max, 
-                                         player1_team[p1_idx].energy + 3)
-        player2_team[p2_idx].energy = min(player2_team[p2_idx].energy_max, 
-                                         player2_team[p2_idx].energy + 3)
+        # Apply end of turn effects and regen energy for both
+        for side in (0, 1):
+            poke = teams[side][idx[side]]
+            was_alive = poke.alive()
+            apply_end_of_turn(stdscr, color_mgr, poke)
+            alive[side] += _alive_change(poke, was_alive)
+            poke.energy = min(poke.energy_max, poke.energy + 3)
     
     # Determine winner and update statistics
     max_y, max_x = stdscr.getmaxyx()
@@ -1854,7 +2123,7 @@ def battle_pvp(stdscr, player1_team: List[Pokemon], player2_team: List[Pokemon],
     winner_player = 0
     loser_pokemon = None
     
-    if any(p.alive() for p in player1_team):
+    if alive[0]:
         message = "[PARTY] PLAYER 1 WINS THE BATTLE! [PARTY]"
         color = 'bright_green'
         winner_player = 1
@@ -1885,18 +2154,15 @@ def battle_pvp(stdscr, player1_team: List[Pokemon], player2_team: List[Pokemon],
     
     # Update and save statistics
     if winner_pokemon and loser_pokemon:
-        stats = load_stats()
+        # update_stats edits in place, so work on a copy rather than the shared cached dict
+        stats = _copy_stats(load_stats())
         update_stats(stats, winner_pokemon, loser_pokemon)
         save_stats(stats)
     
-    # Ensure indices are valid for final display
-    final_p1_idx = p1_idx if p1_idx is not None and p1_idx < len(player1_team) else 0
-    final_p2_idx = p2_idx if p2_idx is not None and p2_idx < len(player2_team) else 0
-    
     draw_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
-                  final_p1_idx, final_p2_idx, message, current_player=1)
-    stdscr.refresh()
-    time.sleep(3)
+                  idx[0], idx[1], message, current_player=1)
+    commit(stdscr)
+    wait_or_skip(stdscr, 3)
     
     # Display match statistics
     display_match_stats(stdscr, color_mgr, player1_team, player2_team, winner_pokemon, winner_player)
@@ -1928,37 +2194,37 @@ def pick_team(stdscr, roster: List[Pokemon], prompt: str, team_size: int, color_
         elif not selected_indices:
             curses_center_text(stdscr, f"You must select exactly {team_size} Pokemon. Press any key to retry.", 
                              max_y - 2, color_mgr.get_color_attr('red'))
+            commit(stdscr)
             stdscr.getch()
             continue
 
-    team = []
-    for idx in selected_indices:
-        original = roster[idx]
-        clone = Pokemon(
-            name=original.name,
-            lvl=original.lvl,
-            max_hp=original.max_hp,
-            atk=original.atk,
-            dfns=original.dfns,
-            spd=original.spd,
-            energy_max=original.energy_max,
-            moves=original.moves,
-            ascii_art=original.ascii_art.copy()
-        )
-        team.append(clone)
-    return team
+    # replace() carries every init field over, so only status needs a fresh dict;
+    # __post_init__ refills hp and energy and rebuilds the derived fields
+    return [replace(roster[idx], status={}) for idx in selected_indices]
 
 def battle_1v3(stdscr, player_team: List[Pokemon], enemy_team: List[Pokemon], color_mgr):
     """1 vs 3 battle mode where player fights against 3 opponents"""
     p1_idx, enemy_idx = 0, 0
+    # Faints are counted off the two active Pokemon, as in battle_pvp; the enemy
+    # side keeps the indices still standing so the next one up is alive_enemies[0]
+    player_alive = sum(1 for p in player_team if p.alive())
+    alive_enemies = [i for i, p in enumerate(enemy_team) if p.alive()]
+    
+    def track_enemy(enemy_was_alive):
+        """Drop the active enemy from alive_enemies if it went down, or put it back if a heal revived it"""
+        change = _alive_change(enemy_team[enemy_idx], enemy_was_alive)
+        if change < 0:
+            alive_enemies.remove(enemy_idx)
+        elif change > 0:
+            bisect.insort(alive_enemies, enemy_idx)
     
     # Initial display
     draw_battle_ui(stdscr, color_mgr, player_team, enemy_team, 
                   p1_idx, enemy_idx, "1v3 BATTLE START! Player vs 3 Enemies!", current_player=1)
-    stdscr.refresh()
-    time.sleep(2)
+    commit(stdscr)
+    wait_or_skip(stdscr, 2)
     
-    while any(p.alive() for p in player_team) and any(p.alive() for p in enemy_team):
+    while player_alive and alive_enemies:
         # Player's turn
         player = player_team[p1_idx]
         enemy = enemy_team[enemy_idx]
@@ -1972,18 +2238,21 @@ def battle_1v3(stdscr, player_team: List[Pokemon], enemy_team: List[Pokemon], co
             player = player_team[p1_idx]
         
         # Player's action
-        can_switch = len([p for p in player_team if p.alive()]) > 1
+        can_switch = player_alive > 1
         p1_action, p1_move, new_p1_idx = get_player_action(stdscr, color_mgr, 
                                                           player_team, enemy_team,
                                                           p1_idx, enemy_idx, 1, can_switch)
         
         if p1_action == "attack" and p1_move:
+            player_was_alive, enemy_was_alive = player.alive(), enemy.alive()
             messages = perform_move(stdscr, color_mgr, player, enemy, p1_move, player_team, enemy_team, p1_idx, enemy_idx, 1)
-            message = "\n".join(messages)
+            player_alive += _alive_change(player, player_was_alive)
+            track_enemy(enemy_was_alive)
+            message = messages
             draw_battle_ui(stdscr, color_mgr, player_team, enemy_team, 
                           p1_idx, enemy_idx, message, current_player=1)
-            stdscr.refresh()
-            time.sleep(2)
+            commit(stdscr)
+            wait_or_skip(stdscr, 2)
             
         elif p1_action == "switch":
             p1_idx = new_p1_idx
@@ -1992,79 +2261,61 @@ def battle_1v3(stdscr, player_team: List[Pokemon], enemy_team: List[Pokemon], co
                                            player_team[p1_idx].energy + 8)
             draw_battle_ui(stdscr, color_mgr, player_team, enemy_team, 
                           p1_idx, enemy_idx, message, current_player=1)
-            stdscr.refresh()
-            time.sleep(1.5)
+            commit(stdscr)
+            wait_or_skip(stdscr, 1.5)
             
         elif p1_action == "pass":
             player.energy = min(player.energy_max, player.energy + 5)
             message = f"{player.name} passes and regains energy!"
             draw_battle_ui(stdscr, color_mgr, player_team, enemy_team, 
                           p1_idx, enemy_idx, message, current_player=1)
-            stdscr.refresh()
-            time.sleep(1)
+            commit(stdscr)
+            wait_or_skip(stdscr, 1)
         
         # Check if current enemy fainted, switch to next available enemy
         if not enemy_team[enemy_idx].alive():
-            # Find next alive enemy
-            enemy_found = False
-            for i in range(len(enemy_team)):
-                if i != enemy_idx and enemy_team[i].alive():
-                    enemy_idx = i
-                    enemy_found = True
-                    break
-            
-            if not enemy_found or not any(p.alive() for p in enemy_team):
+            if not alive_enemies:
                 break
+            enemy_idx = alive_enemies[0]
             
             message = f"{enemy_team[enemy_idx].name} is now fighting!"
             draw_battle_ui(stdscr, color_mgr, player_team, enemy_team, 
                           p1_idx, enemy_idx, message, current_player=2)
-            stdscr.refresh()
-            time.sleep(1.5)
+            commit(stdscr)
+            wait_or_skip(stdscr, 1.5)
         
-        # Enemy's turn (simple AI - random actions)
+        # Enemy's turn (simple AI - random actions); the check above leaves a live enemy up
         player = player_team[p1_idx]
         enemy = enemy_team[enemy_idx]
         
-        # Check if Enemy is alive
-        if not enemy.alive():
-            # Find next alive enemy
-            enemy_found = False
-            for i in range(len(enemy_team)):
-                if enemy_team[i].alive():
-                    enemy_idx = i
-                    enemy_found = True
-                    break
-            
-            if not enemy_found:
-                break
-            enemy = enemy_team[enemy_idx]
-        
         # Simple AI: Choose random available move
-        available_moves = [move for move in enemy.moves if move.energy_cost <= enemy.energy]
+        available_moves = enemy.affordable_moves()
         if available_moves:
-            enemy_move = random.choice(available_moves)
+            enemy_move = _choice(available_moves)
+            player_was_alive, enemy_was_alive = player.alive(), enemy.alive()
             messages = perform_move(stdscr, color_mgr, enemy, player, enemy_move, player_team, enemy_team, p1_idx, enemy_idx, 2)
-            message = "\n".join(messages)
+            player_alive += _alive_change(player, player_was_alive)
+            track_enemy(enemy_was_alive)
+            message = messages
         else:
             enemy.energy = min(enemy.energy_max, enemy.energy + 5)
             message = f"{enemy.name} passes and regains energy!"
         
         draw_battle_ui(stdscr, color_mgr, player_team, enemy_team, 
                       p1_idx, enemy_idx, message, current_player=2)
-        stdscr.refresh()
-        time.sleep(2)
+        commit(stdscr)
+        wait_or_skip(stdscr, 2)
         
         # Check if Player fainted
         if not player_team[p1_idx].alive():
-            if not any(p.alive() for p in player_team):
+            if not player_alive:
                 break
             
             message = f"{player_team[p1_idx].name} fainted! Player, choose your next Pok\u00e9mon."
             draw_battle_ui(stdscr, color_mgr, player_team, enemy_team, 
                           p1_idx, enemy_idx, message, current_player=1)
-            stdscr.refresh()
-            time.sleep(2)
+            commit(stdscr)
+            wait_or_skip(stdscr, 2)
             
             new_p1_idx = prompt_switch(stdscr, color_mgr, player_team, "Player", 'bright_blue')
             if new_p1_idx is None:
@@ -2072,8 +2323,12 @@ def battle_1v3(stdscr, player_team: List[Pokemon], enemy_team: List[Pokemon], co
             p1_idx = new_p1_idx
         
         # Apply end of turn effects
-        apply_end_of_turn(stdscr, color_mgr, player_team[p1_idx])
-        apply_end_of_turn(stdscr, color_mgr, enemy_team[enemy_idx])
+        player, enemy = player_team[p1_idx], enemy_team[enemy_idx]
+        player_was_alive, enemy_was_alive = player.alive(), enemy.alive()
+        apply_end_of_turn(stdscr, color_mgr, player)
+        apply_end_of_turn(stdscr, color_mgr, enemy)
+        player_alive += _alive_change(player, player_was_alive)
+        track_enemy(enemy_was_alive)
         
         # Regen energy for both
         player_team[p1_idx].energy = min(player_team[p1_idx].energy_max, 
@@ -2082,217 +2337,138 @@ def battle_1v3(stdscr, player_team: List[Pokemon], enemy_team: List[Pokemon], co
                                           enemy_team[enemy_idx].energy + 3)
     
     # Determine winner
-    if any(p.alive() for p in player_team):
+    if player_alive:
         message = "[PARTY] PLAYER DEFEATS ALL 3 ENEMIES! [PARTY]"
     else:
         message = "[SKULL] PLAYER DEFEATED BY THE ENEMIES! [SKULL]"
     
     draw_battle_ui(stdscr, color_mgr, player_team, enemy_team, 
                   p1_idx, enemy_idx, message, current_player=1)
-    stdscr.refresh()
-    time.sleep(3)
-
-def draw_vgc_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
-                       p1_active, p2_active, message="", current_player=1):
-    """Draw enhanced VGC battle UI with side-by-side Pokemon display and ASCII art"""
-    stdscr.clear()
-    max_y, max_x = stdscr.getmaxyx()
+    commit(stdscr)
+    wait_or_skip(stdscr, 3)
+
+# Compact 12-cell bars of the VGC layout, indexed by filled cells
+_VGC_BARS = tuple("█" * n + "░" * (12 - n) for n in range(13))
+# Pads holding the parts of the VGC screen that only depend on its size, keyed by (rows, cols)
+_VGC_BACKDROPS = {}
+
+def _draw_vgc_side(stdscr, color_mgr, team, active, x, slot_dx, slots_y, art_y, slot_attr, hp_attr=None):
+    """One player's two active slots side by side, then the art of those still standing below them"""
+    white = color_mgr.get_color_attr('white')
+    cyan = color_mgr.get_color_attr('cyan')
+    yellow = color_mgr.get_color_attr('yellow')
+    standing_attr = color_mgr.get_color_attr('bright_green') | curses.A_BOLD
+    fainted_attr = color_mgr.get_color_attr('bright_red') | curses.A_BOLD
+    
+    shown = [(i, team[active[i]]) for i in range(min(2, len(active))) if active[i] < len(team)]
+    for i, pokemon in shown:
+        y = slots_y + i * 4
+        slot_x = x + slot_dx[i]
+        
+        stdscr.addstr(y, slot_x, f"[{i+1}]", slot_attr)
+        stdscr.addstr(y, slot_x + 3, pokemon.name[:12], 
+                      standing_attr if pokemon.alive() else fainted_attr)
+        stdscr.addstr(y, slot_x + 16, f"Lv{pokemon.lvl}", white)
+        
+        # Bar fill and HP color thresholds in integer math, no float ratio
+        hp, max_hp = pokemon.hp, max(1, pokemon.max_hp)
+        hp_bar = _VGC_BARS[min(12, 12 * hp // max_hp)]
+        line_attr = hp_attr
+        if line_attr is None:  # Player 1's HP is colored by how much is left
+            line_attr = color_mgr.get_color_attr(_HP_COLORS[(4 * hp > max_hp) + (2 * hp > max_hp)])
+        stdscr.addstr(y + 1, slot_x + 3, f"HP:{hp_bar} {pokemon.hp}/{pokemon.max_hp}", line_attr)
+        
+        en_bar = _VGC_BARS[min(12, 12 * pokemon.energy // max(1, pokemon.energy_max))]
+        stdscr.addstr(y + 2, slot_x + 3, f"EN:{en_bar} {pokemon.energy}/{pokemon.energy_max}", cyan)
+        
+        status_line = pokemon.status_marks()
+        if status_line:
+            stdscr.addstr(y + 2, slot_x + 25, status_line, yellow)
+    
+    for i, pokemon in shown:
+        if pokemon.ascii_art and pokemon.alive():
+            # Use animated ASCII with idle state
+            animate_ascii_pokemon(stdscr, color_mgr, pokemon, x + slot_dx[i], art_y, "idle")
+
+def _vgc_backdrop(color_mgr, max_y, max_x):
+    """Border, titles and separator of the VGC screen, painted once per terminal size"""
+    pad = _VGC_BACKDROPS.get((max_y, max_x))
+    if pad is not None:
+        return pad
+    pad = _VGC_BACKDROPS[(max_y, max_x)] = curses.newpad(max_y, max_x)
+    dim_white = color_mgr.get_color_attr('dim_white')
     
     # Enhanced border with corners
     try:
-        stdscr.border('│', '│', '─', '─', '┌', '┐', '└', '┘')
+        pad.border('│', '│', '─', '─', '┌', '┐', '└', '┘')
     except:
-        stdscr.box()
+        pad.box()
     
     # Title with decoration
     title = "⚔ VGC DOUBLE BATTLE ⚔"
-    curses_center_text(stdscr, title, 0, 
+    curses_center_text(pad, title, 0, 
                        color_mgr.get_color_attr('bright_cyan') | curses.A_BOLD)
     
     # Subtitle showing format
     subtitle = "4v4 Format | 2 vs 2 Active"
-    curses_center_text(stdscr, subtitle, 1, 
-                       color_mgr.get_color_attr('dim_white'))
+    curses_center_text(pad, subtitle, 1, dim_white)
     
-    # Calculate layout for side-by-side display
     section_width = max_x // 2 - 4
-    p1_x = 2
-    p2_x = max_x // 2 + 2
     
     # Player 2 Section (TOP RIGHT - OPPONENT)
     p2_title = "≡ PLAYER 2 - OPPONENT ≡"
-    stdscr.addstr(3, p2_x, p2_title[:section_width], 
-                  color_mgr.get_color_attr('bright_magenta') | curses.A_BOLD)
-    
-    # Draw Player 2 active Pokemon side by side
-    for i in range(2):
-        if i < len(p2_active) and p2_active[i] < len(player2_team):
-            p2_pokemon = player2_team[p2_active[i]]
-            y_start = 5 + i * 4
-            x_offset = p2_x + (i % 2) * (section_width // 2)
-            
-            # Slot indicator
-            slot_text = f"[{i+1}]"
-            stdscr.addstr(y_start, x_offset, slot_text, 
-                          color_mgr.get_color_attr('bright_magenta') | curses.A_BOLD)
-            
-            # Pokemon name (truncated if needed)
-            name_display = p2_pokemon.name[:12]
-            color = 'bright_green' if p2_pokemon.alive() else 'bright_red'
-            stdscr.addstr(y_start, x_offset + 3, name_display, 
-                          color_mgr.get_color_attr(color) | curses.A_BOLD)
-            
-            # Level
-            level_text = f"Lv{p2_pokemon.lvl}"
-            stdscr.addstr(y_start, x_offset + 16, level_text, 
-                          color_mgr.get_color_attr('white'))
-            
-            # HP bar (compact)
-            hp_ratio = p2_pokemon.hp / max(1, p2_pokemon.max_hp)
-            hp_bar_length = int(12 * hp_ratio)
-            hp_bar = "█" * hp_bar_length + "░" * (12 - hp_bar_length)
-            stdscr.addstr(y_start + 1, x_offset + 3, f"HP:{hp_bar} {p2_pokemon.hp}/{p2_pokemon.max_hp}", 
-                          color_mgr.get_color_attr('red'))
-            
-            # Energy bar (compact)
-            en_ratio = p2_pokemon.energy / max(1, p2_pokemon.energy_max)
-            en_bar_length = int(12 * en_ratio)
-            en_bar = "█" * en_bar_length + "░" * (12 - en_bar_length)
-            stdscr.addstr(y_start + 2, x_offset + 3, f"EN:{en_bar} {p2_pokemon.energy}/{p2_pokemon.energy_max}", 
-                          color_mgr.get_color_attr('cyan'))
-            
-            # Status indicators
-            if p2_pokemon.status:
-                status_chars = []
-                for k, v in p2_pokemon.status.items():
-                    if isinstance(v, dict) and v.get('turns', 0) > 0:
-                        if k == 'poison':
-                            status_chars.append('P')
-                        elif k == 'burn':
-                            status_chars.append('B')
-                        elif k == 'paralysis':
-                            status_chars.append('Z')
-                    elif isinstance(v, int) and v > 0:
-                        if 'def_up' in k:
-                            status_chars.append('D')
-                        elif 'atk_up' in k:
-                            status_chars.append('⚔')
-                        elif 'spd_up' in k:
-                            status_chars.append('💨')
-                
-                if status_chars:
-                    status_line = ''.join(status_chars[:3])
-                    stdscr.addstr(y_start + 2, x_offset + 25, status_line, 
-                                  color_mgr.get_color_attr('yellow'))
-    
-    # Player 2 ASCII Art Display (Bottom of their section)
-    p2_ascii_y = 14
-    for i in range(2):
-        if i < len(p2_active) and p2_active[i] < len(player2_team):
-            p2_pokemon = player2_team[p2_active[i]]
-            if p2_pokemon.ascii_art and p2_pokemon.alive():
-                art_x = p2_x + i * (section_width // 2)
-                # Use animated ASCII with idle state
-                animate_ascii_pokemon(stdscr, color_mgr, p2_pokemon, art_x, p2_ascii_y, "idle")
+    pad.addstr(3, max_x // 2 + 2, p2_title[:section_width], 
+               color_mgr.get_color_attr('bright_magenta') | curses.A_BOLD)
     
     # Middle separator
     sep_y = max_y // 2
-    for x in range(1, max_x - 1):
-        try:
-            if x % 4 == 0:
-                stdscr.addch(sep_y, x, '┼', color_mgr.get_color_attr('dim_white'))
-            else:
-                stdscr.addch(sep_y, x, '─', color_mgr.get_color_attr('dim_white'))
-        except:
-            pass
+    separator = ''.join('┼' if x % 4 == 0 else '─' for x in range(1, max_x - 1))
+    try:
+        pad.addstr(sep_y, 1, separator, dim_white)
+    except curses.error:
+        pass
     
     # Player 1 Section (BOTTOM LEFT - YOU)
-    p1_y = sep_y + 2
     p1_title = "≡ PLAYER 1 - YOU ≡"
-    stdscr.addstr(p1_y + 1, p1_x, p1_title[:section_width], 
-                  color_mgr.get_color_attr('bright_blue') | curses.A_BOLD)
-    
-    # Draw Player 1 active Pokemon side by side
-    for i in range(2):
-        if i < len(p1_active) and p1_active[i] < len(player1_team):
-            p1_pokemon = player1_team[p1_active[i]]
-            y_start = p1_y + 3 + i * 4
-            x_offset = p1_x + (i % 2) * (section_width // 2)
-            
-            # Slot indicator with highlighting for current player
-            slot_text = f"[{i+1}]"
-            slot_color = 'bright_blue' if current_player == 1 else 'dim_white'
-            stdscr.addstr(y_start, x_offset, slot_text, 
-                          color_mgr.get_color_attr(slot_color) | curses.A_BOLD)
-            
-            # Pokemon name
-            name_display = p1_pokemon.name[:12]
-            color = 'bright_green' if p1_pokemon.alive() else 'bright_red'
-            stdscr.addstr(y_start, x_offset + 3, name_display, 
-                          color_mgr.get_color_attr(color) | curses.A_BOLD)
-            
-            # Level
-            level_text = f"Lv{p1_pokemon.lvl}"
-            stdscr.addstr(y_start, x_offset + 16, level_text, 
-                          color_mgr.get_color_attr('white'))
-            
-            # HP bar with color coding
-            hp_ratio = p1_pokemon.hp / max(1, p1_pokemon.max_hp)
-            hp_bar_length = int(12 * hp_ratio)
-            hp_bar = "█" * hp_bar_length + "░" * (12 - hp_bar_length)
-            hp_color = 'bright_green' if hp_ratio > 0.5 else 'bright_yellow' if hp_ratio > 0.25 else 'bright_red'
-            stdscr.addstr(y_start + 1, x_offset + 3, f"HP:{hp_bar} {p1_pokemon.hp}/{p1_pokemon.max_hp}", 
-                          color_mgr.get_color_attr(hp_color))
-            
-            # Energy bar
-            en_ratio = p1_pokemon.energy / max(1, p1_pokemon.energy_max)
-            en_bar_length = int(12 * en_ratio)
-            en_bar = "█" * en_bar_length + "░" * (12 - en_bar_length)
-            stdscr.addstr(y_start + 2, x_offset + 3, f"EN:{en_bar} {p1_pokemon.energy}/{p1_pokemon.energy_max}", 
-                          color_mgr.get_color_attr('cyan'))
-            
-            # Status indicators
-            if p1_pokemon.status:
-                status_chars = []
-                for k, v in p1_pokemon.status.items():
-                    if isinstance(v, dict) and v.get('turns', 0) > 0:
-                        if k == 'poison':
-                            status_chars.append('P')
-                        elif k == 'burn':
-                            status_chars.append('B')
-                        elif k == 'paralysis':
-                            status_chars.append('Z')
-                    elif isinstance(v, int) and v > 0:
-                        if 'def_up' in k:
-                            status_chars.append('D')
-                        elif 'atk_up' in k:
-                            status_chars.append('⚔')
-                        elif 'spd_up' in k:
-                            status_chars.append('💨')
-                
-                if status_chars:
-                    status_line = ''.join(status_chars[:3])
-                    stdscr.addstr(y_start + 2, x_offset + 25, status_line, 
-                                  color_mgr.get_color_attr('yellow'))
-    
-    # Player 1 ASCII Art Display
-    p1_ascii_y = sep_y + 11
-    for i in range(2):
-        if i < len(p1_active) and p1_active[i] < len(player1_team):
-            p1_pokemon = player1_team[p1_active[i]]
-            if p1_pokemon.ascii_art and p1_pokemon.alive():
-                art_x = p1_x + i * (section_width // 2)
-                # Use animated ASCII with idle state
-                animate_ascii_pokemon(stdscr, color_mgr, p1_pokemon, art_x, p1_ascii_y, "idle")
+    pad.addstr(sep_y + 3, 2, p1_title[:section_width], 
+               color_mgr.get_color_attr('bright_blue') | curses.A_BOLD)
+    return pad
+
+def draw_vgc_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
+                       p1_active, p2_active, message="", current_player=1):
+    """Draw enhanced VGC battle UI with side-by-side Pokemon display and ASCII art"""
+    max_y, max_x = stdscr.getmaxyx()
+    # Copying the backdrop over the whole screen also stands in for erase()
+    backdrop = _vgc_backdrop(color_mgr, max_y, max_x)
+    backdrop.overwrite(stdscr, 0, 0, 0, 0, max_y - 1, max_x - 1)
+    
+    # Calculate layout for side-by-side display
+    section_width = max_x // 2 - 4
+    p1_x = 2
+    p2_x = max_x // 2 + 2
+    # Column offset of each of the two slots within a side's section
+    slot_dx = (0, section_width // 2)
+    
+    # Player 2 Section (TOP RIGHT - OPPONENT), art at the bottom of their section
+    _draw_vgc_side(stdscr, color_mgr, player2_team, p2_active, p2_x, slot_dx, 5, 14, 
+                   color_mgr.get_color_attr('bright_magenta') | curses.A_BOLD, color_mgr.get_color_attr('red'))
+    
+    # Middle separator goes back over any Player 2 art that reached it
+    sep_y = max_y // 2
+    backdrop.overwrite(stdscr, sep_y, 0, sep_y, 0, sep_y, max_x - 1)
+    
+    # Player 1 Section (BOTTOM LEFT - YOU), slot numbers highlighted on their turn
+    p1_slot_attr = color_mgr.get_color_attr('bright_blue' if current_player == 1 else 'dim_white') | curses.A_BOLD
+    _draw_vgc_side(stdscr, color_mgr, player1_team, p1_active, p1_x, slot_dx, sep_y + 5, sep_y + 11, p1_slot_attr)
     
     # Battle message area
     if message:
         msg_y = sep_y - 2
-        msg_lines = message.split('\n')
+        msg_lines = message.split('\n') if isinstance(message, str) else message
+        msg_attr = color_mgr.get_color_attr('bright_yellow')
         for i, line in enumerate(msg_lines[:2]):
             if msg_y - i >= 5:
-                curses_center_text(stdscr, line[:max_x - 8], msg_y - i, 
-                                  color_mgr.get_color_attr('bright_yellow'))
+                curses_center_text(stdscr, line[:max_x - 8], msg_y - i, msg_attr)
     
     # Turn indicator with animation effect
     if current_player == 1:
@@ -2313,8 +2489,7 @@ def draw_vgc_battle_ui(stdscr, color_mgr, player1_team, player2_team,
     
     for i, hint in enumerate(hint_lines):
         if max_y - 2 + i < max_y - 1:
-            curses_center_text(stdscr, hint, max_y - 2 + i, 
-                              color_mgr.get_color_attr('dim_white'))
+            curses_center_text(stdscr, hint, max_y - 2 + i, color_mgr.get_color_attr('dim_white'))
     
     # Speed indicators (show which Pokemon is faster)
     try:
@@ -2326,64 +2501,74 @@ def draw_vgc_battle_ui(stdscr, color_mgr, player1_team, player2_team,
                               color_mgr.get_color_attr('cyan'))
     except:
         pass
-    
-    stdscr.refresh()
+
+# Short tag shown after each move name in the VGC action menu
+_VGC_CATEGORY_TAGS = {"physical": "[P]", "special": "[S]", "mystical-special": "[M]", "status": "[?]"}
 
 def get_vgc_action(stdscr, color_mgr, pokemon: Pokemon, player_team, opponent_team, 
                    player_active, opponent_active, slot_idx, player_num):
     """Get action for VGC battle with enhanced controls"""
     max_y, max_x = stdscr.getmaxyx()
     
+    # Create action menu with enhanced move information; nothing it shows changes
+    # until an action is returned, so it is built once rather than per keypress
+    actions = []
+    # Add attack options with all moves
+    for i, move in enumerate(pokemon.moves):
+        energy_status = "Y" if move.energy_cost <= pokemon.energy else "N"
+        power_text = f"Pow:{move.power}" if move.power > 0 else "Status"
+        cat_emoji = _VGC_CATEGORY_TAGS.get(move.category, "[?]")
+        actions.append(f"{i+1}. {move.name} {cat_emoji} ({power_text}|EN:{move.energy_cost}{energy_status})")
+    
+    # Add switch option if other Pokemon available
+    available_switch = [idx for idx in range(len(player_team)) 
+                      if idx not in player_active and player_team[idx].alive()]
+    if available_switch:
+        actions.append(f"S. Switch Pokemon")
+    
+    actions.append("P. Pass Turn")
+    menu_y = max_y - len(actions) - 6
+    
+    # Show details for first/highlighted move
+    move_info = []
+    if pokemon.moves:
+        move = pokemon.moves[0]  # Default to first move for display
+        move_info = [
+            f"Move: {move.name}",
+            f"Category: {move.category.replace('-', ' ').title()}",
+            f"Power: {move.power}" if move.power > 0 else "Status Effect",
+            f"Energy Cost: {move.energy_cost}",
+            f"Description: {move.description[:40]}{'...' if len(move.description) > 40 else ''}"
+        ]
+    details_y = menu_y + len(actions) + 1
+    
+    prompt = f"Player {player_num} - {pokemon.name} (Slot {slot_idx + 1}) - Choose action:"
+    first_attr = color_mgr.get_color_attr('bright_yellow')
+    white = color_mgr.get_color_attr('white')
+    cyan = color_mgr.get_color_attr('cyan')
+    
+    # Only repaint after a target/switch picker or a message has drawn over the menu;
+    # unhandled keys leave the screen as it is
+    dirty = True
     while True:
-        draw_vgc_battle_ui(stdscr, color_mgr, player_team, opponent_team, 
-                           player_active, opponent_active, 
-                           f"Player {player_num} - {pokemon.name} (Slot {slot_idx + 1}) - Choose action:", player_num)
-        
-        # Create action menu with enhanced move information
-        actions = []
-        # Add attack options with all moves
-        for i, move in enumerate(pokemon.moves):
-            energy_status = "Y" if move.energy_cost <= pokemon.energy else "N"
-            power_text = f"Pow:{move.power}" if move.power > 0 else "Status"
-            cat_emoji = {"physical": "[P]", "special": "[S]", "mystical-special": "[M]", "status": "[?]"}.get(move.category, "[?]")
-            actions.append(f"{i+1}. {move.name} {cat_emoji} ({power_text}|EN:{move.energy_cost}{energy_status})")
-        
-        # Add switch option if other Pokemon available
-        available_switch = [idx for idx in range(len(player_team)) 
-                          if idx not in player_active and player_team[idx].alive()]
-        if available_switch:
-            actions.append(f"S. Switch Pokemon")
-        
-        actions.append("P. Pass Turn")
-        
-        # Draw menu with move details
-        menu_y = max_y - len(actions) - 6
-        for i, action in enumerate(actions):
-            y_pos = menu_y + i
-            color = 'bright_yellow' if i == 0 else 'white'
-            stdscr.addstr(y_pos, 2, action, color_mgr.get_color_attr(color))
-        
-        # Show details for first/highlighted move
-        if pokemon.moves:
-            move = pokemon.moves[0]  # Default to first move for display
-            details_y = menu_y + len(actions) + 1
+        if dirty:
+            draw_vgc_battle_ui(stdscr, color_mgr, player_team, opponent_team, 
+                               player_active, opponent_active, prompt, player_num)
             
-            move_info = [
-                f"Move: {move.name}",
-                f"Category: {move.category.replace('-', ' ').title()}",
-                f"Power: {move.power}" if move.power > 0 else "Status Effect",
-                f"Energy Cost: {move.energy_cost}",
-                f"Description: {move.description[:40]}{'...' if len(move.description) > 40 else ''}"
-            ]
+            # Draw menu with move details
+            for i, action in enumerate(actions):
+                stdscr.addstr(menu_y + i, 2, action, first_attr if i == 0 else white)
             
             for i, info in enumerate(move_info):
                 if details_y + i < max_y - 2:
-                    stdscr.addstr(details_y + i, 2, info, color_mgr.get_color_attr('cyan'))
-        
-        # Instructions
-        instructions = "1-4: Choose Move | S: Switch | P: Pass | Enter: Confirm"
-        curses_center_text(stdscr, instructions, max_y - 1, color_mgr.get_color_attr('dim_white'))
-        
+                    stdscr.addstr(details_y + i, 2, info, cyan)
+            
+            # Instructions
+            instructions = "1-4: Choose Move | S: Switch | P: Pass | Enter: Confirm"
+            curses_center_text(stdscr, instructions, max_y - 1, color_mgr.get_color_attr('dim_white'))
+            
+            commit(stdscr)
+            dirty = False
         key = stdscr.getch()
         
         # Handle number keys for moves
@@ -2404,6 +2589,7 @@ def get_vgc_action(stdscr, color_mgr, pokemon: Pokemon, player_team, opponent_te
                         if available_targets:
                             # Target selection
                             target_idx = select_vgc_target(stdscr, color_mgr, available_targets, player_num)
+                            dirty = True
                             if target_idx is not None:
                                 return {
                                     'type': 'attack',
@@ -2425,13 +2611,15 @@ def get_vgc_action(stdscr, color_mgr, pokemon: Pokemon, player_team, opponent_te
                     draw_vgc_battle_ui(stdscr, color_mgr, player_team, opponent_team, 
                                        player_active, opponent_active, 
                                        "Not enough energy!", player_num)
-                    stdscr.refresh()
+                    commit(stdscr)
                     time.sleep(1)
+                    dirty = True
         
         elif key in [ord('s'), ord('S')]:
             # Switch Pokemon
             if available_switch:
                 new_pokemon_idx = select_vgc_switch(stdscr, color_mgr, player_team, available_switch, player_num)
+                dirty = True
                 if new_pokemon_idx is not None:
                     return {
                         'type': 'switch',
@@ -2455,28 +2643,31 @@ def get_vgc_action(stdscr, color_mgr, pokemon: Pokemon, player_team, opponent_te
                 'pokemon': pokemon,
                 'slot': slot_idx
             }
+        
+        elif key == curses.KEY_RESIZE:
+            dirty = True
 
 def select_vgc_target(stdscr, color_mgr, available_targets, player_num):
     """Select target for VGC battle"""
     max_y, max_x = stdscr.getmaxyx()
     selected = 0
     
+    # The backdrop and instructions don't change; each key only repaints the option rows
+    draw_vgc_battle_ui(stdscr, color_mgr, [], [], [], [], 
+                       f"Player {player_num} - Choose target:", player_num)
+    instructions = "↑↓: Navigate | Enter: Select | q: Cancel"
+    curses_center_text(stdscr, instructions, max_y - 2, color_mgr.get_color_attr('dim_white'))
+    menu_y = max_y // 2 - 5
+    texts = [f"Slot {slot_idx + 1}: {target.name} (HP:{target.hp}/{target.max_hp})"
+             for slot_idx, target in available_targets]
+    
     while True:
-        draw_vgc_battle_ui(stdscr, color_mgr, [], [], [], [], 
-                           f"Player {player_num} - Choose target:", player_num)
-        
         # Draw target options
-        menu_y = max_y // 2 - 5
-        for i, (slot_idx, target) in enumerate(available_targets):
-            y_pos = menu_y + i
+        for i, text in enumerate(texts):
             color = 'black_on_yellow' if i == selected else 'white'
-            text = f"Slot {slot_idx + 1}: {target.name} (HP:{target.hp}/{target.max_hp})"
-            stdscr.addstr(y_pos, max_x // 2 - 20, text, color_mgr.get_color_attr(color))
-        
-        # Instructions
-        instructions = "↑↓: Navigate | Enter: Select | q: Cancel"
-        curses_center_text(stdscr, instructions, max_y - 2, color_mgr.get_color_attr('dim_white'))
+            stdscr.addstr(menu_y + i, max_x // 2 - 20, text, color_mgr.get_color_attr(color))
         
+        commit(stdscr)
         key = stdscr.getch()
         
         if key == curses.KEY_UP:
@@ -2493,23 +2684,22 @@ def select_vgc_switch(stdscr, color_mgr, player_team, available_indices, player_
     max_y, max_x = stdscr.getmaxyx()
     selected = 0
     
+    # The backdrop and instructions don't change; each key only repaints the option rows
+    draw_vgc_battle_ui(stdscr, color_mgr, [], [], [], [], 
+                       f"Player {player_num} - Choose Pokemon to switch in:", player_num)
+    instructions = "↑↓: Navigate | Enter: Select | q: Cancel"
+    curses_center_text(stdscr, instructions, max_y - 2, color_mgr.get_color_attr('dim_white'))
+    menu_y = max_y // 2 - 5
+    texts = [f"{player_team[idx].name} (HP:{player_team[idx].hp}/{player_team[idx].max_hp}) LVL:{player_team[idx].lvl}"
+             for idx in available_indices]
+    
     while True:
-        draw_vgc_battle_ui(stdscr, color_mgr, [], [], [], [], 
-                           f"Player {player_num} - Choose Pokemon to switch in:", player_num)
-        
         # Draw switch options
-        menu_y = max_y // 2 - 5
-        for i, idx in enumerate(available_indices):
-            y_pos = menu_y + i
+        for i, text in enumerate(texts):
             color = 'black_on_yellow' if i == selected else 'white'
-            pokemon = player_team[idx]
-            text = f"{pokemon.name} (HP:{pokemon.hp}/{pokemon.max_hp}) LVL:{pokemon.lvl}"
-            stdscr.addstr(y_pos, max_x // 2 - 20, text, color_mgr.get_color_attr(color))
-        
-        # Instructions
-        instructions = "↑↓: Navigate | Enter: Select | q: Cancel"
-        curses_center_text(stdscr, instructions, max_y - 2, color_mgr.get_color_attr('dim_white'))
+            stdscr.addstr(menu_y + i, max_x // 2 - 20, text, color_mgr.get_color_attr(color))
         
+        commit(stdscr)
         key = stdscr.getch()
         
         if key == curses.KEY_UP:
@@ -2536,19 +2726,17 @@ def battle_vgc(stdscr, player1_team: List[Pokemon], player2_team: List[Pokemon],
     curses_center_text(stdscr, "Each player selects 4 Pokemon, then chooses 2 to start", 3, 
                        color_mgr.get_color_attr('white'))
     
-    stdscr.refresh()
+    commit(stdscr)
     time.sleep(2)
     
     # Player 1 selects 2 active Pokemon with better UI
-    p1_names = [f"{i+1}. {p.name} Lv{p.lvl} | HP:{p.max_hp} | ATK:{p.atk} | DEF:{p.dfns} | SPD:{p.spd}" 
-                for i, p in enumerate(player1_team)]
+    p1_names = [f"{i+1}. {p.summary()}" for i, p in enumerate(player1_team)]
     p1_active_indices = get_multi_selection(stdscr, p1_names, 2, 2,
                                           title="Player 1 - Choose 2 active Pokemon:",
                                           start_y=6, start_x=2, color_mgr=color_mgr)
     
     # Player 2 selects 2 active Pokemon
-    p2_names = [f"{i+1}. {p.name} Lv{p.lvl} | HP:{p.max_hp} | ATK:{p.atk} | DEF:{p.dfns} | SPD:{p.spd}" 
-                for i, p in enumerate(player2_team)]
+    p2_names = [f"{i+1}. {p.summary()}" for i, p in enumerate(player2_team)]
     p2_active_indices = get_multi_selection(stdscr, p2_names, 2, 2,
                                           title="Player 2 - Choose 2 active Pokemon:",
                                           start_y=6, start_x=2, color_mgr=color_mgr)
@@ -2559,12 +2747,18 @@ def battle_vgc(stdscr, player1_team: List[Pokemon], player2_team: List[Pokemon],
     # Show initial battle setup
     draw_vgc_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
                        p1_active, p2_active, "Battle Start! Prepare for VGC combat!", 1)
-    stdscr.refresh()
+    commit(stdscr)
     time.sleep(2)
     
-    # Main VGC battle loop with simultaneous turns
+    # Main VGC battle loop with simultaneous turns; alive holds each side's
+    # standing count, kept current at every point a Pokemon can faint
+    alive = [sum(p.alive() for p in player1_team), sum(p.alive() for p in player2_team)]
+    # (side, team index) of each Pokemon, keyed by identity: clones of one roster
+    # entry compare equal, so .index() could land on the wrong team
+    positions = {id(p): (side, i) for side, team in enumerate((player1_team, player2_team))
+                 for i, p in enumerate(team)}
     turn_count = 1
-    while any(p.alive() for p in player1_team) and any(p.alive() for p in player2_team):
+    while alive[0] and alive[1]:
         # Check if we need to force switch for fainted Pokemon
         for i in range(2):
             if i < len(p1_active) and p1_active[i] is not None and p1_active[i] < len(player1_team) and not player1_team[p1_active[i]].alive():
@@ -2578,7 +2772,7 @@ def battle_vgc(stdscr, player1_team: List[Pokemon], player2_team: List[Pokemon],
                     draw_vgc_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
                                        p1_active, p2_active, 
                                        f"{old_pokemon.name} fainted! {new_pokemon.name} switches in!", 1)
-                    stdscr.refresh()
+                    commit(stdscr)
                     time.sleep(1.5)
             
             if i < len(p2_active) and p2_active[i] is not None and p2_active[i] < len(player2_team) and not player2_team[p2_active[i]].alive():
@@ -2592,7 +2786,7 @@ def battle_vgc(stdscr, player1_team: List[Pokemon], player2_team: List[Pokemon],
                     draw_vgc_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
                                        p1_active, p2_active, 
                                        f"{old_pokemon.name} fainted! {new_pokemon.name} switches in!", 2)
-                    stdscr.refresh()
+                    commit(stdscr)
                     time.sleep(1.5)
         
         # Display VGC battle state
@@ -2634,44 +2828,45 @@ def battle_vgc(stdscr, player1_team: List[Pokemon], player2_team: List[Pokemon],
                 target = action['target']
                 
                 # Find team indices for perform_move
-                if attacker in player1_team:
-                    attacker_idx = player1_team.index(attacker)
-                    current_player = 1
-                else:
-                    attacker_idx = player2_team.index(attacker)
-                    current_player = 2
-                
-                if target in player1_team:
-                    target_idx = player1_team.index(target)
-                else:
-                    target_idx = player2_team.index(target)
+                attacker_side, attacker_idx = positions[id(attacker)]
+                current_player = attacker_side + 1
+                target_side, target_idx = positions[id(target)]
                 
+                attacker_was_alive, target_was_alive = attacker.alive(), target.alive()
                 messages = perform_move(stdscr, color_mgr, attacker, target, move, 
                                        player1_team, player2_team, attacker_idx, target_idx, current_player)
-                message = "\n".join(messages)
+                # Besides knocking out the target, a move's heal effect can bring
+                # an attacker that fainted earlier this turn back up
+                alive[attacker_side] += attacker.alive() - attacker_was_alive
+                if target is not attacker:
+                    alive[target_side] += target.alive() - target_was_alive
+                message = messages
                 
                 draw_vgc_battle_ui(stdscr, color_mgr, player1_team, player2_team, 
                                    p1_active, p2_active, message, current_player)
-                stdscr.refresh()
+                commit(stdscr)
                 time.sleep(2)
         
         # Apply end of turn effects to all active Pokemon
         for i in range(2):
             if i < len(p1_active) and p1_active[i] is not None and p1_active[i] < len(player1_team):
-                apply_end_of_turn(stdscr, color_mgr, player1_team[p1_active[i]])
-                player1_team[p1_active[i]].energy = min(player1_team[p1_active[i]].energy_max, 
-                                                        player1_team[p1_active[i]].energy + 3)
+                poke = player1_team[p1_active[i]]
+                was_alive = poke.alive()
+                apply_end_of_turn(stdscr, color_mgr, poke)
+                alive[0] += _alive_change(poke, was_alive)
+                poke.energy = min(poke.energy_max, poke.energy + 3)
             
             if i < len(p2_active) and p2_active[i] is not None and p2_active[i] < len(player2_team):
-                apply_end_of_turn(stdscr, color_mgr, player2_team[p2_active[i]])
-                player2_team[p2_active[i]].energy = min(player2_team[p2_active[i]].energy_max, 
-                                                        player2_team[p2_active[i]].energy + 3)
+                poke = player2_team[p2_active[i]]
+                was_alive = poke.alive()
+                apply_end_of_turn(stdscr, color_mgr, poke)
+                alive[1] += _alive_change(poke, was_alive)
+                poke.energy = min(poke.energy_max, poke.energy + 3)
         
         turn_count += 1
     
     # Determine winner
-    p1_alive = any(p.alive() for p in player1_team)
-    p2_alive = any(p.alive() for p in player2_team)
+    p1_alive, p2_alive = alive
     
     stdscr.clear()
     max_y, max_x = stdscr.getmaxyx()
@@ -2691,11 +2886,11 @@ def battle_vgc(stdscr, player1_team: List[Pokemon], player2_team: List[Pokemon],
     
     curses_center_text(stdscr, message, max_y//2, 
                        color_mgr.get_color_attr(color) | curses.A_BOLD)
-    stdscr.refresh()
+    commit(stdscr)
     time.sleep(3)
     
-    # Update stats (update all Pokemon that participated)
-    stats = load_stats()
+    # Update stats (update all Pokemon that participated), on a copy of the shared cached dict
+    stats = _copy_stats(load_stats())
     if winner_player == 1:
         # Find winner and loser Pokemon for stats
         for p1_pokemon in player1_team:
@@ -2719,8 +2914,7 @@ def battle_vgc(stdscr, player1_team: List[Pokemon], player2_team: List[Pokemon],
 def main(stdscr):
     """Main game loop"""
     curses.curs_set(0)
-    stdscr.nodelay(False)
-    stdscr.timeout(-1)
+    _block_for_input(stdscr)
     color_mgr = CursesColors()
     
     while True:
@@ -2730,7 +2924,7 @@ def main(stdscr):
         if max_y < 24 or max_x < 80:
             curses_center_text(stdscr, "Terminal too small! Resize to at least 80x24.", max_y//2, 
                              color_mgr.get_color_attr('red') | curses.A_BOLD)
-            stdscr.refresh()
+            commit(stdscr)
             time.sleep(2)
             continue
         
@@ -2747,7 +2941,7 @@ def main(stdscr):
         
         stdscr.addstr(title_y + 4, (max_x - len("2-Player PvP Battle!")) // 2, 
                      "2-Player PvP Battle!", color_mgr.get_color_attr('bright_white'))
-        stdscr.refresh()
+        commit(stdscr)
         time.sleep(0.5)
 
         menu_items = ["1v1 Battle", "1v3 Battle", "3v3 Battle", "6v6 Battle", "VGC 4v4 Double Battle", "View Stats", "Exit Game"]
@@ -2777,24 +2971,9 @@ def main(stdscr):
                 continue
                 
             # Auto-select 3 random enemies for 1v3
-            enemy_team = []
             available_pokemon = [p for p in ROSTER]
-            selected_indices = random.sample(range(len(available_pokemon)), min(3, len(available_pokemon)))
-            
-            for idx in selected_indices:
-                original = available_pokemon[idx]
-                clone = Pokemon(
-                    name=original.name,
-                    lvl=original.lvl,
-                    max_hp=original.max_hp,
-                    atk=original.atk,
-                    dfns=original.dfns,
-                    spd=original.spd,
-                    energy_max=original.energy_max,
-                    moves=original.moves,
-                    ascii_art=original.ascii_art.copy()
-                )
-                enemy_team.append(clone)
+            selected_indices = _RNG.sample(range(len(available_pokemon)), min(3, len(available_pokemon)))
+            enemy_team = [replace(available_pokemon[idx], status={}) for idx in selected_indices]
             
             # Start 1v3 battle
             battle_1v3(stdscr, team1, enemy_team, color_mgr)